@@ -0,0 +1,54 @@
+"""Compare the streaming Schedule_Row parser against the BeautifulSoup path.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parser                    # synthetic 5,000-game fixture
+    python -m benchmarks.bench_parser --games 20000
+    python -m benchmarks.bench_parser --fixture p_content.html   # a captured response
+"""
+import argparse
+import time
+
+from sample_schedule import make_schedule_html
+from soccer_schedule_ics.schedule_parser import parse_schedule, parse_schedule_bs4
+
+
+def best_of(func, p_content, repeat):
+    """Return (best wall time in seconds, result) over repeat runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(p_content)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=5000, help="Games in the synthetic fixture")
+    parser.add_argument('--fixture', help="Captured p_Content HTML file to parse instead")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.fixture:
+        with open(args.fixture, encoding='utf-8') as f:
+            p_content = f.read()
+    else:
+        p_content = make_schedule_html(args.games)
+
+    bs4_time, bs4_rows = best_of(parse_schedule_bs4, p_content, args.repeat)
+    fast_time, fast_rows = best_of(parse_schedule, p_content, args.repeat)
+
+    if fast_rows != bs4_rows:
+        mismatches = sum(1 for a, b in zip(fast_rows, bs4_rows) if a != b) + abs(len(fast_rows) - len(bs4_rows))
+        print(f"⚠️  Parsers disagree on {mismatches} rows")
+
+    print(f"Fixture: {len(p_content) / 1024:.0f} KiB, {len(fast_rows)} rows")
+    print(f"bs4 html.parser: {bs4_time * 1000:8.1f} ms  ({len(bs4_rows) / bs4_time:10.0f} rows/s)")
+    print(f"streaming:       {fast_time * 1000:8.1f} ms  ({len(fast_rows) / fast_time:10.0f} rows/s)")
+    print(f"Speedup: {bs4_time / fast_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Benchmark each stage of the generator: fetch, parse, event building and writing the calendar to disk.
+
+Fixtures grow from one team's season up to a whole association. Fetches go to an
+in-process mock_server, so no network is involved. Run from the repository root:
+
+    python -m benchmarks.bench_pipeline --output bench_results.json
+    python -m benchmarks.bench_pipeline --sizes 20,150 --baseline bench_results.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+# Fetches must go to the mock and not be throttled; set before lisa_api is imported
+os.environ.setdefault('LISA_RATE_LIMIT', '0')
+
+from mock_server import start_server
+
+SIZES = {
+    20: "team season",
+    150: "division",
+    1500: "competition",
+    15000: "association",
+}
+REGRESSION_THRESHOLD = 0.20  # Flag stages more than 20% slower than the baseline
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(func, repeat):
+    """Time func over repeat runs, then once more under tracemalloc for peak memory"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return timings, peak, result
+
+
+def stage_result(stage, games, rows, timings, peak):
+    p50 = percentile(timings, 50)
+    return {
+        'stage': stage,
+        'games': games,
+        'rows': rows,
+        'p50_ms': round(p50 * 1000, 3),
+        'p99_ms': round(percentile(timings, 99) * 1000, 3),
+        'rows_per_s': round(rows / p50) if p50 else None,
+        'peak_mem_kib': round(peak / 1024),
+    }
+
+
+def run(sizes, repeat):
+    from soccer_schedule_ics import lisa_api
+    from soccer_schedule_ics.ics_writer import calendar_header, write_events
+    from soccer_schedule_ics.main import TIMEZONE, build_events, new_calendar, stream_calendar
+    from soccer_schedule_ics.models import Registry
+    from soccer_schedule_ics.schedule_parser import iter_schedule, parse_schedule
+
+    results = []
+    devnull = open(os.devnull, 'w')
+    workdir = tempfile.TemporaryDirectory()
+    now = datetime.now(TIMEZONE)  # Fixed, so a rewrite finds every event unchanged
+    for games in sizes:
+        server, base_url = start_server(games=games)
+        lisa_api.URL = f"{base_url}/GSServicePublic.asmx/LOAD_SchedulePublic"
+        payload = lisa_api.build_payload("12", -1, -1, games="ALL")
+        try:
+            timings, peak, p_content = measure(lambda: lisa_api.post_schedule(payload), repeat)
+        finally:
+            server.shutdown()
+            server.server_close()
+        results.append(stage_result('fetch', games, games, timings, peak))
+
+        timings, peak, rows = measure(lambda: parse_schedule(p_content), repeat)
+        results.append(stage_result('parse', games, len(rows), timings, peak))
+
+        output = os.path.join(workdir.name, f"{games}.ics")
+        header = calendar_header(new_calendar("Benchmark", "Benchmark"))
+
+        def fresh(func):
+            if os.path.exists(output):
+                os.remove(output)
+            return func()
+
+        with contextlib.redirect_stdout(devnull):
+            timings, peak, events = measure(lambda: list(build_events(Registry().games(rows), now)), repeat)
+            results.append(stage_result('build_events', games, len(rows), timings, peak))
+
+            timings, peak, _ = measure(lambda: fresh(lambda: write_events(header, events, output, now)), repeat)
+            results.append(stage_result('write', games, len(rows), timings, peak))
+            # Every event unchanged: blocks are copied from the previous file
+            timings, peak, _ = measure(lambda: write_events(header, events, output, now), repeat)
+            results.append(stage_result('rewrite', games, len(rows), timings, peak))
+
+            # What main.py does on a changed schedule: parse, build and write VEVENTs in one streaming pass
+            timings, peak, _ = measure(lambda: fresh(lambda: stream_calendar(
+                Registry().games(iter_schedule(p_content)), "Benchmark", "Benchmark", output, now)), repeat)
+            results.append(stage_result('stream', games, len(rows), timings, peak))
+
+        for result in results[-6:]:
+            print(f"{result['stage']:>13} {games:>6} games ({SIZES.get(games, 'custom'):>11}): "
+                  f"p50 {result['p50_ms']:9.2f} ms  p99 {result['p99_ms']:9.2f} ms  "
+                  f"{result['rows_per_s'] or 0:>9} rows/s  peak {result['peak_mem_kib']:>7} KiB")
+    devnull.close()
+    workdir.cleanup()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """Print p50 changes against a previous run. Returns the number of regressions."""
+    with open(baseline_path) as f:
+        baseline = {(r['stage'], r['games']): r for r in json.load(f)['results']}
+    regressions = 0
+    print(f"\nCompared to {baseline_path}:")
+    for result in results:
+        old = baseline.get((result['stage'], result['games']))
+        if not old or not old['p50_ms']:
+            continue
+        change = result['p50_ms'] / old['p50_ms'] - 1
+        flag = ""
+        if change > REGRESSION_THRESHOLD:
+            regressions += 1
+            flag = "  ⚠️  REGRESSION"
+        print(f"{result['stage']:>13} {result['games']:>6} games: {change:+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(str(size) for size in SIZES),
+                        help="Comma-separated fixture sizes in games")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per stage")
+    parser.add_argument('--output', help="Write results to this JSON file")
+    parser.add_argument('--baseline', help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    results = run([int(size) for size in args.sizes.split(',')], args.repeat)
+
+    if args.output:
+        report = {
+            'meta': {
+                'commit': git_commit(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'repeat': args.repeat,
+            },
+            'results': results,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Results written to {args.output}")
+
+    if args.baseline and compare(results, args.baseline):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Measure cold-start cost: interpreter start, imports, and the unchanged-schedule fast path.
+
+Every scheduled run starts a fresh interpreter, and most of them end at the
+change check, so what soccer_schedule_ics.main imports before that check is most of their cost.
+Uses -X importtime in subprocesses against an in-process mock_server. Run from
+the repository root:
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 10 --budget-ms 40
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from mock_server import start_server
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = ['-m', 'soccer_schedule_ics']
+
+# Modules the unchanged fast path must not load (requests itself is needed for the fetch)
+HEAVY_MODULES = ('icalendar', 'bs4', 'soccer_schedule_ics.schedule_parser', 'soccer_schedule_ics.ics_writer',
+                 'soccer_schedule_ics.parse_pool')
+DEFAULT_BUDGET_MS = 50  # Cumulative import time of main itself
+
+_IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def parse_importtime(stderr):
+    """-X importtime output -> {module: (self µs, cumulative µs, depth)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), len(indent) // 2)
+    return modules
+
+
+def run(args, env, cwd):
+    """Run python -X importtime with args; returns (wall seconds, exit code, modules)"""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', *args], env=env, cwd=cwd,
+                            capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    return elapsed, result.returncode, parse_importtime(result.stderr)
+
+
+def best_of(args, env, cwd, repeat):
+    runs = [run(args, env, cwd) for _ in range(repeat)]
+    return min(runs, key=lambda r: r[0])
+
+
+def report(label, elapsed, modules, top):
+    """Print wall time and the slowest top-level imports; returns total import time in ms"""
+    top_level = sorted(((cumulative, name) for name, (_, cumulative, depth) in modules.items() if depth == 0),
+                       reverse=True)
+    imports_ms = sum(cumulative for cumulative, _ in top_level) / 1000
+    print(f"{label}: {elapsed * 1000:7.1f} ms wall, {imports_ms:6.1f} ms in imports, {len(modules)} modules")
+    for cumulative, name in top_level[:top]:
+        print(f"    {cumulative / 1000:7.1f} ms  {name}")
+    return imports_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per measurement (best is reported)")
+    parser.add_argument('--games', type=int, default=200, help="Games in the mock schedule")
+    parser.add_argument('--top', type=int, default=8, help="Slowest top-level imports to list")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help="Fail if importing main takes longer than this")
+    args = parser.parse_args()
+
+    server, base_url = start_server(games=args.games)
+    env = dict(os.environ, LISA_BASE_URL=base_url, LISA_RATE_LIMIT='0', PYTHONPATH=ROOT)
+    failures = []
+    try:
+        with tempfile.TemporaryDirectory() as workdir:
+            elapsed, _, _ = best_of(['-c', 'pass'], env, workdir, args.repeat)
+            print(f"Interpreter only: {elapsed * 1000:7.1f} ms wall")
+
+            elapsed, _, modules = best_of(['-c', 'import soccer_schedule_ics.main'], env, workdir, args.repeat)
+            report("import main", elapsed, modules, args.top)
+            import_ms = modules['soccer_schedule_ics.main'][1] / 1000
+            if import_ms > args.budget_ms:
+                failures.append(f"importing main took {import_ms:.1f} ms (budget {args.budget_ms:g} ms)")
+
+            # The first run builds the calendar; the rest find it unchanged and exit 3
+            subprocess.run([sys.executable, *MAIN], env=env, cwd=workdir, capture_output=True, check=True)
+            elapsed, code, modules = best_of(MAIN, env, workdir, args.repeat)
+            report("Unchanged run", elapsed, modules, args.top)
+            if code != 3:
+                failures.append(f"unchanged run exited {code}, expected 3")
+            loaded = [name for name in HEAVY_MODULES if name in modules]
+            if loaded:
+                failures.append(f"unchanged run imported {', '.join(loaded)}")
+    finally:
+        server.shutdown()
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        sys.exit(1)
+    print("✅ Fast path stays within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,118 +1,81 @@
-import requests
-import json
-from bs4 import BeautifulSoup
-import re
+from soccer_schedule_ics.discover import open_index
+from soccer_schedule_ics.lisa_api import build_payload, fetch_many, parse_cache_args
+from soccer_schedule_ics.scanner import scan_divisions
+from soccer_schedule_ics.schedule_store import DB_PATH
+from soccer_schedule_ics.schedule_parser import parse_schedule
+
+WEEK_MIN = "2025|9|1:2025|9|7"
+WEEK_MAX = "2026|1|31:2026|2|7"
+SEED_RANGES = [(1, 10), (50, 59), (100, 109), (150, 159), (200, 209)]
 
 def find_competitions_and_divisions():
     """Try different competition and division combinations"""
-    url = "https://lisa.gameschedule.ca/GSServicePublic.asmx/LOAD_SchedulePublic"
-    
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "x-requested-with": "XMLHttpRequest",
-    }
-    
-    # Try different competition IDs
+    # "-1" already covers every competition, so it alone finds the live divisions;
+    # the narrower sets are only tried on those to tell which competition they are in
     competition_sets = [
         "6|7|10|9",  # Current
-        "1|2|3|4|5|6|7|8|9|10|11|12",  # Try more
         "11|12|13|14|15",  # Higher numbers
-        "-1"  # All
+        "1|2|3|4|5|6|7|8|9|10|11|12",  # Try more
     ]
     
     found_data = {}
+    conn = open_index()
+    
+    def payload_for(comp):
+        return lambda div_id: build_payload(comp, div_id, games="ALL", week_min=WEEK_MIN, week_max=WEEK_MAX)
+    
+    print(f"Scanning division IDs around {', '.join(f'{low}-{high}' for low, high in SEED_RANGES)}...")
+    scope = f"-1|{WEEK_MIN}|{WEEK_MAX}"
+    live, errors, probes = scan_divisions(conn, scope, SEED_RANGES, payload_for("-1"), min_content=500)
     
+    competition_of = {div_id: "-1" for div_id in live}
     for comp in competition_sets:
-        print(f"\nTrying competition: {comp}")
-        
-        # Try with broader division search
-        for div_start in [1, 50, 100, 150, 200]:
-            for div_id in range(div_start, div_start + 10):
-                payload = {
-                    "strCompetition": comp,
-                    "strFiltersXML": f"""
-                        <FILTERS>
-                            <DATERANGE>
-                                <NAME>DATERANGE</NAME>
-                                <VALUE>-1</VALUE>
-                            </DATERANGE>
-                            <CLUB>
-                                <NAME>CLUB</NAME>
-                                <VALUE>-1</VALUE>
-                            </CLUB>
-                            <DIVISION>
-                                <NAME>DIVISION</NAME>
-                                <VALUE>{div_id}</VALUE>
-                            </DIVISION>
-                            <TEAM>
-                                <NAME>TEAM</NAME>
-                                <VALUE>-1</VALUE>
-                            </TEAM>
-                            <FIELD>
-                                <NAME>FIELD</NAME>
-                                <VALUE>-1</VALUE>
-                            </FIELD>
-                            <GAMES>
-                                <NAME>GAMES</NAME>
-                                <VALUE>ALL</VALUE>
-                            </GAMES>
-                        </FILTERS>
-                    """,
-                    "strWeekMax": "2026|1|31:2026|2|7",
-                    "strWeekMin": "2025|9|1:2025|9|7"
+        div_ids = [div_id for div_id, found_in in sorted(competition_of.items()) if found_in == "-1"]
+        if not div_ids:
+            break
+        probes += len(div_ids)
+        for i, p_content, error in fetch_many([payload_for(comp)(div_id) for div_id in div_ids], timeout=5):
+            if not error and p_content and len(p_content) > 500 and parse_schedule(p_content):
+                competition_of[div_ids[i]] = comp
+    
+    for div_id, games in sorted(live.items()):
+        comp = competition_of[div_id]
+        # Get division info
+        for game in games[:3]:
+            division_name = game.home_division
+            if division_name is None:
+                division_name = game.away_division
+            
+            if division_name:
+                # Look for teams
+                teams = set()
+                home_team = game.home_team or ""
+                away_team = game.guest_team or ""
+                
+                if home_team and home_team != "--":
+                    teams.add(home_team)
+                if away_team and away_team != "--":
+                    teams.add(away_team)
+                
+                key = f"{comp}|{div_id}"
+                found_data[key] = {
+                    'division_name': division_name,
+                    'division_id': div_id,
+                    'competition': comp,
+                    'teams': teams
                 }
                 
-                try:
-                    response = requests.post(url, headers=headers, json=payload, timeout=5)
-                    
-                    if response.status_code == 200:
-                        json_response = response.json()
-                        p_content = json_response.get('d', {}).get('p_Content', None)
-                        
-                        if p_content and len(p_content) > 500:  # Has substantial content
-                            soup = BeautifulSoup(p_content, 'html.parser')
-                            games = soup.find_all("div", class_="Schedule_Row")
-                            
-                            if games:
-                                # Get division info
-                                for game in games[:3]:
-                                    div_elem = game.find("div", class_="Schedule_Home_Division")
-                                    if not div_elem:
-                                        div_elem = game.find("div", class_="Schedule_Away_Division")
-                                    
-                                    if div_elem:
-                                        division_name = div_elem.text.strip()
-                                        if division_name:
-                                            # Look for teams
-                                            teams = set()
-                                            home = game.find("div", class_="Schedule_Home_Text")
-                                            away = game.find("div", class_="Schedule_Away_Text")
-                                            
-                                            home_team = home.text.strip() if home else ""
-                                            away_team = away.text.strip() if away else ""
-                                            
-                                            if home_team and home_team != "--":
-                                                teams.add(home_team)
-                                            if away_team and away_team != "--":
-                                                teams.add(away_team)
-                                            
-                                            key = f"{comp}|{div_id}"
-                                            found_data[key] = {
-                                                'division_name': division_name,
-                                                'division_id': div_id,
-                                                'competition': comp,
-                                                'teams': teams
-                                            }
-                                            
-                                            # Print if it might be U16
-                                            if "16" in division_name or "Lakehill" in home_team or "Lakehill" in away_team:
-                                                print(f"  *** Found: Division {div_id} = {division_name}")
-                                                print(f"      Teams: {home_team} vs {away_team}")
-                                            
-                                            break  # Found division name, move to next
-                except Exception as e:
-                    continue
+                # Print if it might be U16
+                if "16" in division_name or "Lakehill" in home_team or "Lakehill" in away_team:
+                    print(f"  *** Found: Competition {comp}, Division {div_id} = {division_name}")
+                    print(f"      Teams: {home_team} vs {away_team}")
+                
+                break  # Found division name, move to next
+    
+    print(f"\nFound {len(live)} live divisions with {probes} requests")
+    if errors:
+        print(f"⚠️  {len(errors)} division IDs failed and were not checked: {', '.join(map(str, sorted(errors)))}")
+        print(f"   Progress is saved in {DB_PATH}; run again to retry just those")
     
     print("\n\n=== ALL DIVISIONS FOUND ===")
     for key, data in sorted(found_data.items(), key=lambda x: x[1]['division_name']):
@@ -128,4 +91,5 @@ def find_competitions_and_divisions():
             print(f"Competition: {comp}, Division ID: {div_id}, Name: {div_name}")
 
 if __name__ == "__main__":
+    parse_cache_args(cache_by_default=True)
     find_competitions_and_divisions()
\ No newline at end of file
@@ -1,96 +1,48 @@
-import requests
-import json
-from bs4 import BeautifulSoup
-import re
+from soccer_schedule_ics.discover import open_index
+from soccer_schedule_ics.lisa_api import build_payload, parse_cache_args
+from soccer_schedule_ics.scanner import scan_divisions
+from soccer_schedule_ics.schedule_store import DB_PATH
 
 def try_division_range():
     """Try different division IDs to find U16"""
-    url = "https://lisa.gameschedule.ca/GSServicePublic.asmx/LOAD_SchedulePublic"
-    
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "x-requested-with": "XMLHttpRequest",
-    }
-    
     # Try division IDs around 69 (current U14 division)
     # U16 might be a higher number
     found_divisions = {}
     
-    print("Testing division IDs from 65 to 85...")
-    for div_id in range(65, 86):
-        payload = {
-            "strCompetition": "6|7|10|9",
-            "strFiltersXML": f"""
-                <FILTERS>
-                    <DATERANGE>
-                        <NAME>DATERANGE</NAME>
-                        <VALUE>-1</VALUE>
-                    </DATERANGE>
-                    <CLUB>
-                        <NAME>CLUB</NAME>
-                        <VALUE>-1</VALUE>
-                    </CLUB>
-                    <DIVISION>
-                        <NAME>DIVISION</NAME>
-                        <VALUE>{div_id}</VALUE>
-                    </DIVISION>
-                    <TEAM>
-                        <NAME>TEAM</NAME>
-                        <VALUE>-1</VALUE>
-                    </TEAM>
-                    <FIELD>
-                        <NAME>FIELD</NAME>
-                        <VALUE>-1</VALUE>
-                    </FIELD>
-                    <GAMES>
-                        <NAME>GAMES</NAME>
-                        <VALUE>ALL</VALUE>
-                    </GAMES>
-                </FILTERS>
-            """,
-            "strWeekMax": "2025|12|31:2026|1|6",
-            "strWeekMin": "2025|9|1:2025|9|7"
-        }
+    print("Testing division IDs from 65 to 85 (and around any hits)...")
+    week_min, week_max = "2025|9|1:2025|9|7", "2025|12|31:2026|1|6"
+    scope = f"6|7|10|9|{week_min}|{week_max}"
+    live, errors, probes = scan_divisions(
+        open_index(), scope, [(65, 85)],
+        lambda div_id: build_payload("6|7|10|9", div_id, games="ALL", week_min=week_min, week_max=week_max),
+        timeout=10)
+    
+    for div_id, games in sorted(live.items()):
+        # Get division name from first game
+        division_name = games[0].home_division
+        if division_name is None:
+            division_name = games[0].away_division
         
-        try:
-            response = requests.post(url, headers=headers, json=payload, timeout=10)
+        if division_name:
+            found_divisions[div_id] = division_name
             
-            if response.status_code == 200:
-                json_response = response.json()
-                p_content = json_response.get('d', {}).get('p_Content', None)
-                
-                if p_content and len(p_content) > 100:  # Has content
-                    soup = BeautifulSoup(p_content, 'html.parser')
-                    games = soup.find_all("div", class_="Schedule_Row")
-                    
-                    if games:
-                        # Get division name from first game
-                        div_elem = games[0].find("div", class_="Schedule_Home_Division")
-                        if not div_elem:
-                            div_elem = games[0].find("div", class_="Schedule_Away_Division")
-                        
-                        if div_elem:
-                            division_name = div_elem.text.strip()
-                            if division_name:
-                                found_divisions[div_id] = division_name
-                                
-                                # Check for teams in this division
-                                teams = set()
-                                for game in games[:5]:
-                                    home = game.find("div", class_="Schedule_Home_Text")
-                                    away = game.find("div", class_="Schedule_Away_Text")
-                                    if home and home.text.strip() != "--":
-                                        teams.add(home.text.strip())
-                                    if away and away.text.strip() != "--":
-                                        teams.add(away.text.strip())
-                                
-                                if "16" in division_name or "Lakehill" in str(teams):
-                                    print(f"*** Division {div_id}: {division_name} - Teams: {', '.join(sorted(teams)[:3])}...")
-                                else:
-                                    print(f"Division {div_id}: {division_name}")
-        except Exception as e:
-            continue
+            # Check for teams in this division
+            teams = set()
+            for game in games[:5]:
+                if game.home_team is not None and game.home_team != "--":
+                    teams.add(game.home_team)
+                if game.guest_team is not None and game.guest_team != "--":
+                    teams.add(game.guest_team)
+            
+            if "16" in division_name or "Lakehill" in str(teams):
+                print(f"*** Division {div_id}: {division_name} - Teams: {', '.join(sorted(teams)[:3])}...")
+            else:
+                print(f"Division {div_id}: {division_name}")
+    
+    print(f"\nFound {len(live)} live divisions with {probes} requests")
+    if errors:
+        print(f"⚠️  {len(errors)} division IDs failed and were not checked: {', '.join(map(str, sorted(errors)))}")
+        print(f"   Progress is saved in {DB_PATH}; run again to retry just those")
     
     print("\n=== SUMMARY ===")
     for div_id, div_name in sorted(found_divisions.items()):
@@ -100,4 +52,5 @@ def try_division_range():
             print(f"Division ID {div_id}: {div_name}")
 
 if __name__ == "__main__":
+    parse_cache_args(cache_by_default=True)
     try_division_range()
\ No newline at end of file
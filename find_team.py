@@ -1,116 +1,36 @@
-import requests
-import json
-from bs4 import BeautifulSoup
-import re
+from soccer_schedule_ics.lisa_api import build_payload, parse_cache_args, post_schedule
+from soccer_schedule_ics.schedule_parser import parse_schedule
 
 def find_u16_teams():
     """Search for U16 teams and divisions"""
-    url = "https://lisa.gameschedule.ca/GSServicePublic.asmx/LOAD_SchedulePublic"
-    
-    headers = {
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "x-requested-with": "XMLHttpRequest",
-    }
-    
     # Search with a wider date range
-    payload = {
-        "strCompetition": "6|7|10|9",
-        "strFiltersXML": """
-            <FILTERS>
-                <DATERANGE>
-                    <NAME>DATERANGE</NAME>
-                    <VALUE>-1</VALUE>
-                </DATERANGE>
-                <CLUB>
-                    <NAME>CLUB</NAME>
-                    <VALUE>-1</VALUE>
-                </CLUB>
-                <DIVISION>
-                    <NAME>DIVISION</NAME>
-                    <VALUE>-1</VALUE>
-                </DIVISION>
-                <TEAM>
-                    <NAME>TEAM</NAME>
-                    <VALUE>-1</VALUE>
-                </TEAM>
-                <FIELD>
-                    <NAME>FIELD</NAME>
-                    <VALUE>-1</VALUE>
-                </FIELD>
-                <GAMES>
-                    <NAME>GAMES</NAME>
-                    <VALUE>ALL</VALUE>
-                </GAMES>
-            </FILTERS>
-        """,
-        "strWeekMax": "2025|12|31:2026|1|6",
-        "strWeekMin": "2025|9|1:2025|9|7"
-    }
+    payload = build_payload("6|7|10|9", games="ALL", week_min="2025|9|1:2025|9|7", week_max="2025|12|31:2026|1|6")
     
     print("Searching for U16 teams and divisions...")
-    response = requests.post(url, headers=headers, json=payload, timeout=60)
-    
-    if response.status_code != 200:
-        print(f"Error: {response.status_code}")
+    try:
+        p_content = post_schedule(payload, timeout=60)
+    except Exception as e:
+        print(f"Error: {e}")
         return
     
-    json_response = response.json()
-    p_content = json_response.get('d', {}).get('p_Content', None)
-    
     if not p_content:
         print("No content found")
         return
     
-    soup = BeautifulSoup(p_content, 'html.parser')
-    
     # Look for team IDs and division info
     team_divisions = {}
     
     # Find all games
-    games = soup.find_all("div", class_="Schedule_Row")
+    games = parse_schedule(p_content)
     print(f"\nFound {len(games)} games total")
     
     for game in games:
-        # Home team
-        home_outer = game.find("div", class_="Schedule_HomeOuter")
-        if home_outer and home_outer.get('onclick'):
-            onclick = home_outer.get('onclick')
-            team_id_match = re.search(r'PAGE_LoadTeam\((\d+)\)', onclick)
-            if team_id_match:
-                team_id = team_id_match.group(1)
-                
-                home_text = game.find("div", class_="Schedule_Home_Text")
-                home_div = game.find("div", class_="Schedule_Home_Division")
-                
-                if home_text and home_div:
-                    team_name = home_text.text.strip()
-                    division = home_div.text.strip()
-                    
-                    if team_name and team_name != "--":
-                        if team_name not in team_divisions:
-                            team_divisions[team_name] = {}
-                        team_divisions[team_name][division] = team_id
-        
-        # Away team
-        away_outer = game.find("div", class_="Schedule_AwayOuter")
-        if away_outer and away_outer.get('onclick'):
-            onclick = away_outer.get('onclick')
-            team_id_match = re.search(r'PAGE_LoadTeam\((\d+)\)', onclick)
-            if team_id_match:
-                team_id = team_id_match.group(1)
-                
-                away_text = game.find("div", class_="Schedule_Away_Text")
-                away_div = game.find("div", class_="Schedule_Away_Division")
-                
-                if away_text and away_div:
-                    team_name = away_text.text.strip()
-                    division = away_div.text.strip()
-                    
-                    if team_name and team_name != "--":
-                        if team_name not in team_divisions:
-                            team_divisions[team_name] = {}
-                        team_divisions[team_name][division] = team_id
+        for team_id, team_name, division in [(game.home_id, game.home_team, game.home_division),
+                                             (game.away_id, game.guest_team, game.away_division)]:
+            if team_id and team_name and team_name != "--" and division is not None:
+                if team_name not in team_divisions:
+                    team_divisions[team_name] = {}
+                team_divisions[team_name][division] = team_id
     
     # Filter for U16 and Lakehill
     print("\n=== U16 TEAMS AND DIVISIONS ===")
@@ -146,4 +66,5 @@ def find_u16_teams():
             print(f"  {div}")
 
 if __name__ == "__main__":
+    parse_cache_args(cache_by_default=True)
     find_u16_teams()
\ No newline at end of file
@@ -0,0 +1,193 @@
+"""Local stand-in for the LISA GameSchedule LOAD_SchedulePublic endpoint.
+
+Serves recorded fixtures or synthetic Schedule_Row HTML in the real
+{"d": {"p_Content": ...}} shape, with optional latency and error injection:
+
+    python mock_server.py --port 8765 --games 500 --latency 80 --error-rate 0.02
+    LISA_BASE_URL=http://127.0.0.1:8765 python -m soccer_schedule_ics
+
+Record a real response as a fixture (served for that division from then on):
+
+    python mock_server.py record --competition 12 --division 161 --fixtures fixtures/
+"""
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sample_schedule import make_schedule_html
+
+ENDPOINT = "/GSServicePublic.asmx/LOAD_SchedulePublic"
+TEAMS_PER_DIVISION = 10
+
+_ROW_SPLIT_RE = re.compile(r'(?=<div class="Schedule_Row")')
+
+
+def filter_value(filters_xml, name):
+    """VALUE of a filter element (e.g. DIVISION) in strFiltersXML, or '-1'"""
+    match = re.search(rf'<{name}>.*?<VALUE>(.*?)</VALUE>', filters_xml or '', re.S)
+    return match.group(1).strip() if match else '-1'
+
+
+def only_team(p_content, team):
+    """Keep just the Schedule_Rows a team plays in"""
+    marker = f"PAGE_LoadTeam({team})"
+    rows = _ROW_SPLIT_RE.split(p_content)
+    return "".join(row for row in rows[1:] if marker in row)
+
+
+class ScheduleSource:
+    """Decides what p_Content to return for a request"""
+
+    def __init__(self, games=200, fixtures=None, live_divisions=None):
+        self.games = games
+        self.fixtures = fixtures
+        self.live_divisions = live_divisions
+
+    def fixture(self, division):
+        if not self.fixtures:
+            return None
+        for name in (f"{division}.html", "default.html"):
+            path = os.path.join(self.fixtures, name)
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as f:
+                    return f.read()
+        return None
+
+    @lru_cache(maxsize=256)
+    def synthetic(self, division):
+        if division == -1:
+            return make_schedule_html(self.games, teams_per_division=TEAMS_PER_DIVISION)
+        return make_schedule_html(self.games, n_divisions=1, teams_per_division=TEAMS_PER_DIVISION,
+                                  seed=division, first_division=division)
+
+    def content(self, payload):
+        filters = payload.get('strFiltersXML', '')
+        division = int(filter_value(filters, 'DIVISION'))
+        team = int(filter_value(filters, 'TEAM'))
+        if self.live_divisions is not None and division != -1 and division not in self.live_divisions:
+            return ""
+
+        p_content = self.fixture(division)
+        if p_content is None:
+            p_content = self.synthetic(division)
+            if team != -1 and division != -1:
+                # Let the requested team ID stand in for the division's first synthetic team
+                p_content = p_content.replace(f"PAGE_LoadTeam({100 + division * TEAMS_PER_DIVISION})",
+                                              f"PAGE_LoadTeam({team})")
+        if team != -1:
+            p_content = only_team(p_content, team)
+        return p_content
+
+
+def make_handler(source, latency=0.0, jitter=0.0, error_rate=0.0, quiet=False):
+    rng = random.Random()
+    rng_lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, like the real server
+        disable_nagle_algorithm = True  # Headers and body go out in separate writes
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            if self.path != ENDPOINT:
+                return self.reply(404, {"Message": "Unknown web method"})
+            with rng_lock:
+                delay = max(0.0, rng.gauss(latency, jitter)) if jitter else latency
+                fail = rng.random() < error_rate
+            if delay:
+                time.sleep(delay / 1000)
+            if fail:
+                return self.reply(500, {"Message": "Injected error"})
+            try:
+                payload = json.loads(body)
+                p_content = source.content(payload)
+            except (ValueError, TypeError) as e:
+                return self.reply(500, {"Message": f"Bad request: {e}"})
+            self.reply(200, {"d": {"__type": "GSServicePublic.ReturnValue", "p_Content": p_content}})
+
+        def reply(self, status, obj):
+            data = json.dumps(obj).encode('utf-8')
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            if not quiet:
+                super().log_message(format, *args)
+
+    return Handler
+
+
+def start_server(host="127.0.0.1", port=0, games=200, fixtures=None, live_divisions=None,
+                 latency=0.0, jitter=0.0, error_rate=0.0, quiet=True):
+    """Start a mock server on a background thread. Returns (server, base_url)."""
+    source = ScheduleSource(games=games, fixtures=fixtures, live_divisions=live_divisions)
+    server = ThreadingHTTPServer((host, port), make_handler(source, latency, jitter, error_rate, quiet))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def record(competition, division, fixtures, team=-1, games="ALL"):
+    """Fetch a real response and save its p_Content as a fixture for that division"""
+    from soccer_schedule_ics.lisa_api import build_payload, fetch_schedule
+
+    p_content = fetch_schedule(build_payload(competition, division, team, games=games))
+    os.makedirs(fixtures, exist_ok=True)
+    path = os.path.join(fixtures, f"{division}.html")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(p_content)
+    print(f"✅ Recorded {len(p_content)} bytes to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock LISA GameSchedule server")
+    sub = parser.add_subparsers(dest='command')
+
+    rec = sub.add_parser('record', help="Save a real API response as a fixture")
+    rec.add_argument('--competition', required=True)
+    rec.add_argument('--division', type=int, required=True)
+    rec.add_argument('--team', type=int, default=-1)
+    rec.add_argument('--fixtures', default='fixtures')
+
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--games', type=int, default=200, help="Synthetic games per response (10 to 100000)")
+    parser.add_argument('--fixtures', help="Directory of <division>.html / default.html recorded responses")
+    parser.add_argument('--live-divisions', default='all',
+                        help="Divisions that have games, e.g. '1-20,161'; others return empty content")
+    parser.add_argument('--latency', type=float, default=0.0, help="Mean response latency in ms")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Latency standard deviation in ms")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests that get HTTP 500")
+    parser.add_argument('--quiet', action='store_true', help="Don't log each request")
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record(args.competition, args.division, args.fixtures, team=args.team)
+        return
+
+    from soccer_schedule_ics.discover import parse_id_ranges
+
+    live_divisions = None if args.live_divisions in ('', 'all') else set(parse_id_ranges(args.live_divisions))
+    source = ScheduleSource(games=args.games, fixtures=args.fixtures, live_divisions=live_divisions)
+    server = ThreadingHTTPServer((args.host, args.port),
+                                 make_handler(source, args.latency, args.jitter, args.error_rate, args.quiet))
+    server.daemon_threads = True
+    print(f"Mock LISA API on http://{args.host}:{args.port}{ENDPOINT}")
+    print(f"Point the scripts at it with: LISA_BASE_URL=http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import random
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+DAYS = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+CLUBS = ['Lakehill', 'Bays', 'Peninsula', 'Gorge', 'Juan de Fuca', 'Prospect Lake', 'Saanich Fusion', 'Castaways']
+FIELDS = ['Reynolds Park', 'Blue Heron Turf', 'Braefoot Park', 'Royal Oak Turf', 'Layritz Park', 'Finlayson Turf']
+TIMES = ['9:00 AM', '10:30 AM', '12:00 PM', '1:30 PM', '3:00 PM', '4:30 PM', 'TBD']
+
+ROW_TEMPLATE = """<div class="Schedule_Row" id="game{game_id}">
+    <div class="Schedule_Date"><b>{month} {day} - {weekday}</b><br /><span class="Schedule_Week">Week {week}</span></div>
+    <div class="Schedule_Time">{time}</div>
+    <div class="Schedule_HomeOuter" onclick="PAGE_LoadTeam({home_id})">
+        <div class="Schedule_Home_Logo"><img src="/logos/{home_id}.png" alt="" /></div>
+        <div class="Schedule_Home_Text">{home}</div>
+        <div class="Schedule_Home_Division">{division}</div>
+    </div>
+    <div class="Schedule_Score"><span>{home_score}</span> - <span>{away_score}</span></div>
+    <div class="Schedule_AwayOuter" onclick="PAGE_LoadTeam({away_id})">
+        <div class="Schedule_Away_Logo"><img src="/logos/{away_id}.png" alt="" /></div>
+        <div class="Schedule_Away_Text">{away}</div>
+        <div class="Schedule_Away_Division">{division}</div>
+    </div>
+    <div class="Schedule_Field"><div class="Schedule_Field_Name">{field}</div><div class="Schedule_Field_Map">Map</div></div>
+</div>
+"""
+
+
+def team_name(slot, division):
+    """Name for the team in slot of a division, unique within the division"""
+    club = CLUBS[slot % len(CLUBS)]
+    suffix = f" {slot // len(CLUBS) + 1}" if slot >= len(CLUBS) else ""
+    return f"{club}{suffix} U{8 + division % 10} T{division % 4 + 1}"
+
+
+def make_schedule_html(n_games, n_divisions=None, teams_per_division=10, seed=0, first_division=0):
+    """Build synthetic p_Content HTML shaped like a LOAD_SchedulePublic response.
+
+    Games are spread over divisions of teams_per_division teams each, numbered
+    from first_division (team IDs are unique across divisions). A sprinkling of
+    BYE (--) opponents and TBD times keep the skip paths exercised.
+    """
+    rng = random.Random(seed)
+    if n_divisions is None:
+        n_divisions = max(1, n_games // (teams_per_division * 15))
+    parts = []
+    for game_id in range(n_games):
+        division = first_division + rng.randrange(n_divisions)
+        home_slot, away_slot = rng.sample(range(teams_per_division), 2)
+        home_id = 100 + division * teams_per_division + home_slot
+        away_id = 100 + division * teams_per_division + away_slot
+        month = rng.choice([8, 9, 10, 11, 0, 1, 2])
+        day = rng.randint(1, 28)
+        parts.append(ROW_TEMPLATE.format(
+            game_id=game_id,
+            month=MONTHS[month],
+            day=day,
+            weekday=DAYS[day % 7],
+            week=game_id % 30 + 1,
+            time=rng.choice(TIMES),
+            home_id=home_id,
+            away_id=away_id,
+            home=team_name(home_slot, division),
+            away="--" if rng.random() < 0.03 else team_name(away_slot, division),
+            division=f"U{8 + division % 10} Div{division % 4 + 1} ({division})",
+            home_score=rng.randint(0, 5),
+            away_score=rng.randint(0, 5),
+            field=rng.choice(FIELDS),
+        ))
+    return '<div class="Schedule_Container">\n' + "".join(parts) + "</div>\n"
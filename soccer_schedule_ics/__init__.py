@@ -0,0 +1 @@
+"""Generate ICS calendars from the LISA GameSchedule API (see main for the CLI)"""
@@ -0,0 +1,4 @@
+from .main import main
+
+if __name__ == "__main__":  # Pool workers started with spawn/forkserver import this module too
+    main()
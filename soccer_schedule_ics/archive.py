@@ -0,0 +1,233 @@
+"""History of every parsed schedule, stored as compressed deltas.
+
+    python -m soccer_schedule_ics --archive                                    # record schedules as they are parsed
+    python -m soccer_schedule_ics.archive changes --since 2025-10-01                # what changed since then (or --since 2d)
+    python -m soccer_schedule_ics.archive at 2025-10-15T18:00 --key "12|161|841"    # the schedule as it was at that time
+    python -m soccer_schedule_ics.archive keys
+
+Each schedule (keyed by the competition|division|team it was fetched with) is
+a chain of snapshots. A snapshot stores only the games added, changed or
+removed since the previous one, as zlib-compressed JSON, with a full keyframe
+every KEYFRAME_EVERY snapshots, so rebuilding any point in time decompresses at
+most that many. Runs where no game changed store nothing, so the archive grows
+with the number of changes rather than with runs x schedule size.
+
+Schedules are fetched UNPLAYED, so games drop out once they are played. A game
+that disappears after its date is kept as played rather than recorded as
+removed; only upcoming games that disappear are removals (cancellations).
+"""
+import argparse
+import json
+import re
+import sqlite3
+import time
+import zlib
+from datetime import datetime
+
+from .ics_writer import GameUids
+from .models import date_int, format_time
+from .season import TIMEZONE
+
+ARCHIVE_PATH = 'schedule_archive.db'
+KEYFRAME_EVERY = 32  # Snapshots per full copy; bounds the work of rebuilding one point in time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL,              -- competition|division|team the schedule was fetched with
+    taken_at REAL NOT NULL,
+    version TEXT NOT NULL,          -- Fingerprint of the response the games were parsed from
+    keyframe INTEGER NOT NULL,      -- 1: data holds every game, 0: only the changes since the previous snapshot
+    games INTEGER NOT NULL,         -- Games in the schedule after this snapshot
+    data BLOB NOT NULL              -- zlib-compressed JSON {"set": {uid: game}, "del": [uid, ...]}
+);
+CREATE INDEX IF NOT EXISTS snapshots_by_key ON snapshots(key, taken_at);
+"""
+
+_RELATIVE_RE = re.compile(r'^(\d+)([dh])$')
+
+
+def connect(path=ARCHIVE_PATH):
+    """Open (and if needed create) the archive"""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def game_records(games):
+    """uid -> [date, time, home, away, field] for the playable games (BYEs have no UID)"""
+    records = {}
+    game_uid = GameUids()
+    for game in games:
+        if game.is_bye:
+            continue
+        uid = game_uid(game.year, game.month, game.day, game.home.key, game.away.key)
+        records[uid] = [game.date, game.time, game.home.name, game.away.name, game.field]
+    return records
+
+
+def _pack(changed, removed):
+    return zlib.compress(json.dumps({'set': changed, 'del': sorted(removed)}, separators=(',', ':')).encode(), 9)
+
+
+def _unpack(data):
+    delta = json.loads(zlib.decompress(data))
+    return delta['set'], delta['del']
+
+
+def state_at(conn, key, until=None):
+    """(uid -> game as of until, snapshots since the last keyframe); ({}, 0) if nothing was archived by then.
+
+    Starts from the newest keyframe at or before until and applies the deltas after it.
+    """
+    until = until if until is not None else float('inf')
+    start = conn.execute("SELECT id FROM snapshots WHERE key = ? AND keyframe = 1 AND taken_at <= ? "
+                         "ORDER BY id DESC LIMIT 1", (key, until)).fetchone()
+    if start is None:
+        return {}, 0
+    state = {}
+    count = 0
+    for keyframe, data in conn.execute("SELECT keyframe, data FROM snapshots WHERE key = ? AND id >= ? "
+                                       "AND taken_at <= ? ORDER BY id", (key, start[0], until)):
+        changed, removed = _unpack(data)
+        if keyframe:
+            state, count = {}, 0
+        else:
+            count += 1
+        for uid in removed:
+            state.pop(uid, None)
+        state.update(changed)
+    return state, count
+
+
+def record(conn, key, games, version, taken_at=None):
+    """Archive a parsed schedule. Returns how many games were added, changed or removed (0 stores nothing)."""
+    taken_at = taken_at or time.time()
+    current = game_records(games)
+    previous, since_keyframe = state_at(conn, key)
+    today = _local_date(taken_at)
+    for uid, game in previous.items():
+        if uid not in current and game[0] < today:  # Played, not cancelled
+            current[uid] = game
+    changed = {uid: game for uid, game in current.items() if previous.get(uid) != game}
+    removed = [uid for uid in previous if uid not in current]
+    if not changed and not removed:
+        return 0
+
+    keyframe = not previous or since_keyframe + 1 >= KEYFRAME_EVERY
+    data = _pack(current, []) if keyframe else _pack(changed, removed)
+    with conn:
+        conn.execute("INSERT INTO snapshots (key, taken_at, version, keyframe, games, data) VALUES (?, ?, ?, ?, ?, ?)",
+                     (key, taken_at, version, int(keyframe), len(current), data))
+    return len(changed) + len(removed)
+
+
+def changes(conn, since, key=None):
+    """Yield (taken_at, key, kind, uid, before, after) for every change after since, oldest first.
+
+    kind is 'added', 'changed' or 'removed'; before/after are the game records
+    ([date, time, home, away, field]) or None.
+    """
+    keys = [key] if key else [row[0] for row in conn.execute("SELECT DISTINCT key FROM snapshots WHERE taken_at > ? "
+                                                             "ORDER BY key", (since,))]
+    for schedule_key in keys:
+        state = state_at(conn, schedule_key, since)[0]
+        for taken_at, keyframe, data in conn.execute("SELECT taken_at, keyframe, data FROM snapshots WHERE key = ? "
+                                                     "AND taken_at > ? ORDER BY id", (schedule_key, since)):
+            changed, removed = _unpack(data)
+            if keyframe:  # A full copy: whatever it doesn't list was removed
+                removed = [uid for uid in state if uid not in changed]
+                changed = {uid: game for uid, game in changed.items() if state.get(uid) != game}
+            for uid in removed:
+                yield taken_at, schedule_key, 'removed', uid, state.pop(uid, None), None
+            for uid, game in changed.items():
+                before = state.get(uid)
+                yield taken_at, schedule_key, 'added' if before is None else 'changed', uid, before, game
+                state[uid] = game
+
+
+def describe(game):
+    date_int, minutes, home, away, field = game
+    return (f"{home} vs {away} on {date_int // 10000:04d}-{date_int // 100 % 100:02d}-{date_int % 100:02d} "
+            f"at {format_time(minutes)}, {field or 'no field'}")
+
+
+def describe_change(before, after):
+    """'time 10:00 AM -> 2:30 PM, field Lakehill Turf -> Braefoot 1'"""
+    parts = []
+    if before[1] != after[1]:
+        parts.append(f"time {format_time(before[1])} -> {format_time(after[1])}")
+    if before[4] != after[4]:
+        parts.append(f"field {before[4] or 'none'} -> {after[4] or 'none'}")
+    if before[2:4] != after[2:4]:
+        parts.append(f"teams {before[2]} vs {before[3]} -> {after[2]} vs {after[3]}")
+    return ", ".join(parts)
+
+
+def parse_when(text):
+    """'2025-10-01', '2025-10-01T18:00' (local time) or '2d' / '12h' ago -> Unix time"""
+    match = _RELATIVE_RE.match(text.strip())
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        return time.time() - amount * (86400 if unit == 'd' else 3600)
+    when = datetime.fromisoformat(text.strip())
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=TIMEZONE)
+    return when.timestamp()
+
+
+def _local_date(timestamp):
+    day = datetime.fromtimestamp(timestamp, TIMEZONE)
+    return date_int(day.year, day.month, day.day)
+
+
+def _local(timestamp):
+    return datetime.fromtimestamp(timestamp, TIMEZONE).strftime('%Y-%m-%d %H:%M')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Schedule history archive")
+    parser.add_argument('--db', default=ARCHIVE_PATH)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    changes_cmd = sub.add_parser('changes', help="List the changes since a point in time")
+    changes_cmd.add_argument('--since', required=True, help="ISO date/time (local) or e.g. 2d / 12h ago")
+    changes_cmd.add_argument('--key', help="Only this schedule (competition|division|team)")
+
+    at_cmd = sub.add_parser('at', help="Show a schedule as it was at a point in time")
+    at_cmd.add_argument('when', help="ISO date/time (local) or e.g. 2d / 12h ago")
+    at_cmd.add_argument('--key', required=True)
+
+    sub.add_parser('keys', help="List the archived schedules")
+
+    args = parser.parse_args()
+    conn = connect(args.db)
+
+    if args.command == 'changes':
+        found = 0
+        for taken_at, key, kind, _, before, after in changes(conn, parse_when(args.since), args.key):
+            found += 1
+            if kind == 'added':
+                print(f"{_local(taken_at)}  [{key}] ➕ {describe(after)}")
+            elif kind == 'removed':
+                print(f"{_local(taken_at)}  [{key}] ➖ {describe(before)}")
+            else:
+                print(f"{_local(taken_at)}  [{key}] ✏️  {describe(after)} ({describe_change(before, after)})")
+        print(f"{found} changes")
+    elif args.command == 'at':
+        state = state_at(conn, args.key, parse_when(args.when))[0]
+        for game in sorted(state.values(), key=lambda game: (game[0], game[1] if game[1] is not None else -1)):
+            print(f"  {describe(game)}")
+        print(f"{len(state)} games")
+    elif args.command == 'keys':
+        for key, snapshots, first, last, games, size in conn.execute(
+                "SELECT key, COUNT(*), MIN(taken_at), MAX(taken_at), "
+                "(SELECT games FROM snapshots AS latest WHERE latest.key = s.key ORDER BY id DESC LIMIT 1), "
+                "SUM(LENGTH(data)) FROM snapshots AS s GROUP BY key ORDER BY key"):
+            print(f"  {key}: {games} games, {snapshots} snapshots from {_local(first)} to {_local(last)}, "
+                  f"{size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
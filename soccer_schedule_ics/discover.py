@@ -0,0 +1,197 @@
+"""Crawl division IDs once into the local store, then answer team lookups from it.
+
+    python -m soccer_schedule_ics.discover crawl --divisions 1-300
+    python -m soccer_schedule_ics.discover query "Lakehill U16 T3"
+    python -m soccer_schedule_ics.discover crawl --divisions 1-300 --refresh-days 7   # incremental re-crawl
+"""
+import argparse
+import re
+import time
+from difflib import SequenceMatcher
+
+from .lisa_api import build_payload, fetch_many, parse_cache_args
+from .metrics import METRICS
+from .schedule_parser import parse_schedule
+from .schedule_store import DB_PATH, connect, store_rows
+
+CRAWL_WEEK_MIN = "2025|8|18:2025|8|24"
+CRAWL_WEEK_MAX = "2026|7|27:2026|8|2"
+BATCH_SIZE = 40         # Division IDs probed between checkpoints
+EMPTY_RECHECK_DAYS = 30  # Dead IDs are re-probed less often than live ones
+
+PROBES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS probes (
+    competition TEXT NOT NULL,      -- Competition filter; scanner.py adds its week range ('-1|<min>|<max>')
+    division_id INTEGER NOT NULL,
+    status TEXT NOT NULL,           -- live, empty or error
+    games INTEGER NOT NULL,
+    probed_at REAL NOT NULL,
+    bytes INTEGER,                  -- Response size, so an empty page can be told from a truncated one
+    PRIMARY KEY (competition, division_id)
+);
+"""
+
+_TOKEN_RE = re.compile(r'[a-z]+|\d+')
+
+
+def parse_id_ranges(spec):
+    """'1-20,50,161' -> [1, ..., 20, 50, 161]"""
+    ids = []
+    for part in spec.split(','):
+        low, _, high = part.partition('-')
+        ids.extend(range(int(low), int(high or low) + 1))
+    return ids
+
+
+def open_index(path=DB_PATH):
+    conn = connect(path)
+    conn.executescript(PROBES_SCHEMA)
+    if 'bytes' not in {column[1] for column in conn.execute("PRAGMA table_info(probes)")}:
+        conn.execute("ALTER TABLE probes ADD COLUMN bytes INTEGER")  # Indexes from before probes had one
+    return conn
+
+
+def probe_states(conn, competition):
+    """division ID -> (status, probed_at) for every ID probed under competition"""
+    return {
+        division_id: (status, probed_at)
+        for division_id, status, probed_at in conn.execute(
+            "SELECT division_id, status, probed_at FROM probes WHERE competition = ?", (competition,))
+    }
+
+
+def record_probes(conn, competition, results):
+    """Save a batch of (division ID, status, games, response bytes) probe outcomes.
+
+    Committed, so a crawl can resume after it. Failed probes have None for bytes.
+    """
+    now = time.time()
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO probes (competition, division_id, status, games, probed_at, bytes) "
+                         "VALUES (?, ?, ?, ?, ?, ?)",
+                         [(competition, division_id, status, games, now, size)
+                          for division_id, status, games, size in results])
+
+
+def due_for_probe(conn, competition, division_ids, refresh_days=None):
+    """The IDs that were never probed, errored, or are older than the refresh window"""
+    now = time.time()
+    probed = probe_states(conn, competition)
+    due = []
+    for division_id in division_ids:
+        if division_id not in probed:
+            due.append(division_id)
+            continue
+        status, probed_at = probed[division_id]
+        age_days = (now - probed_at) / 86400
+        if status == 'error':
+            due.append(division_id)
+        elif refresh_days is not None and age_days >= (EMPTY_RECHECK_DAYS if status == 'empty' else refresh_days):
+            due.append(division_id)
+    return due
+
+
+def crawl(conn, competition, division_ids, refresh_days=None):
+    """Probe division IDs concurrently, checkpointing each batch so a crawl can resume"""
+    todo = due_for_probe(conn, competition, division_ids, refresh_days)
+    print(f"Probing {len(todo)} of {len(division_ids)} division IDs (others are already indexed)")
+    live = 0
+    for start in range(0, len(todo), BATCH_SIZE):
+        batch = todo[start:start + BATCH_SIZE]
+        payloads = [build_payload(competition, division_id, games="ALL", week_min=CRAWL_WEEK_MIN,
+                                  week_max=CRAWL_WEEK_MAX) for division_id in batch]
+        results = []
+        for i, p_content, error in fetch_many(payloads, timeout=20):
+            division_id = batch[i]
+            if error:
+                results.append((division_id, 'error', 0, None, None))
+                continue
+            with METRICS.stage('parse'):
+                rows = parse_schedule(p_content) if p_content else []
+            results.append((division_id, 'live' if rows else 'empty', len(rows), len(p_content or ''), rows))
+
+        for division_id, status, games, _, rows in results:
+            if rows:
+                live += 1
+                store_rows(conn, rows, competition, division_id, week_min=CRAWL_WEEK_MIN, week_max=CRAWL_WEEK_MAX)
+                division = rows[0].home_division or rows[0].away_division
+                print(f"  Division {division_id}: {division} ({games} games)")
+        record_probes(conn, competition, [result[:4] for result in results])
+    return live
+
+
+def tokens(text):
+    return _TOKEN_RE.findall(text.lower())
+
+
+def score(query_tokens, query_text, candidate):
+    """How well a 'team name + division' string matches the query, from 0 to ~1"""
+    candidate_tokens = tokens(candidate)
+    if not candidate_tokens:
+        return 0.0
+    total = 0.0
+    for token in query_tokens:
+        best = 0.0
+        for other in candidate_tokens:
+            if token == other:
+                best = 1.0
+                break
+            if other.startswith(token) or token.startswith(other):
+                best = max(best, 0.8)
+            elif not token.isdigit() and not other.isdigit():
+                best = max(best, SequenceMatcher(None, token, other).ratio() * 0.9)
+        total += best
+    # Small tie-breaker on the whole string so closer overall names rank first
+    return total / len(query_tokens) + 0.05 * SequenceMatcher(None, query_text, candidate.lower()).ratio()
+
+
+def query(conn, text, limit=10):
+    """Best matching (score, team id, team name, division, division id) for a free-text query"""
+    query_tokens = tokens(text)
+    if not query_tokens:
+        return []
+    # "U16" in a query should also match divisions written as "16B" or "U-16"
+    query_tokens = [token for token in query_tokens if token != 'u'] or query_tokens
+    candidates = conn.execute(
+        "SELECT teams.id, teams.name, teams.division, divisions.division_id FROM teams "
+        "LEFT JOIN divisions ON divisions.name = teams.division")
+    scored = []
+    for team_id, name, division, division_id in candidates:
+        candidate = f"{name} {division or ''}"
+        scored.append((score(query_tokens, text.lower(), candidate), team_id, name, division, division_id))
+    scored.sort(key=lambda match: -match[0])
+    return scored[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Team/division discovery index")
+    parser.add_argument('--db', default=DB_PATH)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    crawl_cmd = sub.add_parser('crawl', help="Probe division IDs into the index")
+    crawl_cmd.add_argument('--competition', default="-1", help="Competition filter (-1 covers all)")
+    crawl_cmd.add_argument('--divisions', default="1-300", help="Division IDs, e.g. '1-300' or '60-90,161'")
+    crawl_cmd.add_argument('--refresh-days', type=float,
+                           help="Re-probe live IDs older than this (empty ones after 30 days)")
+
+    query_cmd = sub.add_parser('query', help="Fuzzy team lookup, e.g. 'Lakehill U16 T3'")
+    query_cmd.add_argument('text')
+    query_cmd.add_argument('--limit', type=int, default=10)
+
+    args = parse_cache_args(parser, cache_by_default=True)
+    conn = open_index(args.db)
+
+    if args.command == 'crawl':
+        live = crawl(conn, args.competition, parse_id_ranges(args.divisions), args.refresh_days)
+        print(f"✅ Indexed {live} live divisions")
+    else:
+        matches = query(conn, args.text, args.limit)
+        if not matches:
+            print("No teams indexed yet. Run: python -m soccer_schedule_ics.discover crawl")
+        for match_score, team_id, name, division, division_id in matches:
+            division_label = f"{division} (ID {division_id})" if division_id is not None else division
+            print(f"  {match_score:4.2f}  {name} - Division: {division_label} - Team ID: {team_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Exhibition games from a CSV sheet, merged into the league schedule.
+
+    Date,Time,Home Team,Guest Team,Field
+    2024-11-02,2:30 PM,Peninsula U15T3,Lakehill U14 Tier 3,Blue Heron Turf
+
+Sheets are parsed once per change (checked by mtime and size, then content
+hash), and merged with a hash join: the sheet's games are indexed by
+(date, normalized teams) and each league game is looked up as it streams past.
+"""
+import hashlib
+import os
+import re
+
+from .metrics import METRICS
+from .models import REGISTRY, Game
+
+EXHIBITION_FILE = 'exhibition.csv'
+
+_NAME_RE = re.compile(r'[^a-z0-9]+')
+
+# path -> (mtime_ns, size, content hash, games)
+_loaded = {}
+
+
+def normalize_team(name):
+    """'Lakehill U14 Tier 3' -> 'lakehillu14t3', so spelling variants of a team compare equal"""
+    return _NAME_RE.sub('', name.lower().replace('tier', 't'))
+
+
+def game_key(game):
+    """(date, teams) identity of a game, regardless of which side is home"""
+    return game.date, frozenset((normalize_team(game.home.name), normalize_team(game.away.name)))
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as csv_file:
+        for chunk in iter(lambda: csv_file.read(64 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sheet_hash(path=EXHIBITION_FILE):
+    """The sheet's content hash without parsing it (None if there is no sheet), for change checks"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    cached = _loaded.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    return _file_hash(path)
+
+
+def load_exhibition_games(path=EXHIBITION_FILE):
+    """Exhibition games as Game records, and a hash of the sheet (None if there is no sheet).
+
+    The sheet is streamed row by row, and isn't parsed again while its mtime
+    and size stay the same, or while its content hash does if it was touched.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return [], None
+    cached = _loaded.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[3], cached[2]
+
+    content_hash = _file_hash(path)
+    if cached and cached[2] == content_hash:
+        _loaded[path] = (stat.st_mtime_ns, stat.st_size) + cached[2:]
+        return cached[3], content_hash
+
+    import csv
+
+    games = []
+    with METRICS.stage('exhibition_load'), open(path, mode='r', newline='', encoding='utf-8-sig') as csv_file:
+        for row in csv.reader(csv_file):
+            if not row or row[0] == 'Date':  # Blank line or header
+                continue
+            try:
+                games.append(REGISTRY.exhibition_game(*row[:5]))
+            except (TypeError, ValueError) as e:
+                print(f"❌ Skipping exhibition game {row}: {e}")
+    _loaded[path] = (stat.st_mtime_ns, stat.st_size, content_hash, games)
+    return games, content_hash
+
+
+def merge_exhibition(games, exhibition_games):
+    """Yield league games with the exhibition games merged in.
+
+    An exhibition game on the same date between the same teams as a league
+    game is that league game: if its time or field differ it is treated as a
+    reschedule (the league game keeps its UID but takes the sheet's time and
+    field), otherwise it is a duplicate and dropped. The remaining exhibition
+    games follow the league games. games can be a lazy iterator.
+    """
+    index = {}
+    for game in exhibition_games:
+        if not game.is_bye:
+            index[game_key(game)] = game
+
+    for game in games:
+        if index and not game.is_bye:
+            exhibition = index.pop(game_key(game), None)
+            if exhibition is not None:
+                if (exhibition.time, exhibition.field) != (game.time, game.field):
+                    METRICS.count('exhibition_reschedules')
+                    game = Game(game.date, exhibition.time, game.home, game.away, exhibition.field or game.field)
+                else:
+                    METRICS.count('exhibition_duplicates')
+        yield game
+
+    for game in index.values():
+        METRICS.count('exhibition_games')
+        yield game
@@ -0,0 +1,174 @@
+import hashlib
+import os
+import re
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+from zoneinfo import ZoneInfo
+
+UID_DOMAIN = "soccer-schedule-ics"
+LOCAL_TZ = ZoneInfo('America/Los_Angeles')  # Decides which games are already in the past
+
+_VOLATILE_RE = re.compile(rb'^(?:DTSTAMP|SEQUENCE|STATUS)[;:].*\r\n', re.M)
+
+
+def game_uid(year, month, day, home, guest, occurrence=0):
+    """Deterministic UID for a game from its date and teams (IDs where we have them).
+
+    occurrence numbers repeat meetings of the same home and guest on the same
+    day; the first one keeps the plain UID.
+    """
+    key = f"{year:04d}{month:02d}{day:02d}|{home}|{guest}"
+    if occurrence:
+        key += f"|{occurrence}"
+    return f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]}@{UID_DOMAIN}"
+
+
+class GameUids:
+    """game_uid for one schedule's games, in schedule order, numbering same-day repeat meetings"""
+
+    def __init__(self):
+        self.seen = {}  # (date, home, guest) -> meetings so far
+
+    def __call__(self, year, month, day, home, guest):
+        key = (year, month, day, home, guest)
+        occurrence = self.seen.get(key, 0)
+        self.seen[key] = occurrence + 1
+        return game_uid(year, month, day, home, guest, occurrence)
+
+
+def _prop(block, name):
+    """Raw value of a property in a serialized VEVENT, or None"""
+    match = re.search(rb'^' + name + rb'[;:](?:[^:\r\n]*:)?([^\r\n]*)\r\n', block, re.M)
+    return match.group(1).decode() if match else None
+
+
+def _stable(block):
+    """A VEVENT with the per-revision properties removed, for change detection"""
+    return _VOLATILE_RE.sub(b'', block)
+
+
+def _with_revision(block, sequence, dtstamp, status=None):
+    """Re-stamp a serialized VEVENT with a new SEQUENCE/DTSTAMP (and optional STATUS)"""
+    lines = f"DTSTAMP:{dtstamp}\r\nSEQUENCE:{sequence}\r\n"
+    if status:
+        lines += f"STATUS:{status}\r\n"
+    return _stable(block)[:-len(b'END:VEVENT\r\n')] + lines.encode() + b'END:VEVENT\r\n'
+
+
+class IndexedEvent(NamedTuple):
+    """Where a VEVENT sits in a file, plus what merging needs to know about it"""
+    offset: int
+    length: int
+    digest: bytes        # sha1 of the block without DTSTAMP/SEQUENCE/STATUS
+    sequence: int
+    status: Optional[str]
+    dtstart: str
+
+
+def _index_entry(block, offset):
+    return IndexedEvent(offset, len(block), hashlib.sha1(_stable(block)).digest(),
+                        int(_prop(block, b'SEQUENCE') or 0), _prop(block, b'STATUS'), _prop(block, b'DTSTART') or '')
+
+
+def index_events(path):
+    """Map UID -> IndexedEvent for an existing .ics file, reading it a line at a time"""
+    events = {}
+    try:
+        ics_file = open(path, 'rb')
+    except FileNotFoundError:
+        return events
+    with ics_file:
+        offset = 0
+        block = None
+        for line in ics_file:
+            if line == b'BEGIN:VEVENT\r\n':
+                block, start = [], offset
+            if block is not None:
+                block.append(line)
+                if line == b'END:VEVENT\r\n':
+                    data = b''.join(block)
+                    uid = _prop(data, b'UID')
+                    if uid:
+                        events[uid] = _index_entry(data, start)
+                    block = None
+            offset += len(line)
+    return events
+
+
+def calendar_header(calendar):
+    """Serialized VCALENDAR properties of calendar, without its events or END line"""
+    events = calendar.subcomponents
+    calendar.subcomponents = []
+    try:
+        return calendar.to_ical()[:-len(b'END:VCALENDAR\r\n')]
+    finally:
+        calendar.subcomponents = events
+
+
+def write_events(header, events, output, now=None):
+    """Stream icalendar Events into output, keeping unchanged VEVENTs from the previous file byte-identical.
+
+    Events are serialized one at a time into a spool file next to output, so
+    neither the event objects nor the serialized calendar are held in memory;
+    only a small (DTSTART, UID, location) index is. Unchanged events are copied
+    from the previous file. Changed events get SEQUENCE bumped and a fresh
+    DTSTAMP. Events that disappeared are marked CANCELLED if they were still
+    upcoming, and dropped once they are in the past (UNPLAYED schedules stop
+    listing games after they are played). The finished file is sorted by
+    DTSTART and swapped in atomically.
+    """
+    now = now or datetime.now(timezone.utc)
+    dtstamp = now.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    today = now.astimezone(LOCAL_TZ).strftime('%Y%m%d')
+    previous = index_events(output)
+    spool_path = f"{output}.spool"
+    tmp_path = f"{output}.tmp"
+
+    # UID -> (DTSTART, file the block lives in, offset, length)
+    placed = {}
+    old_file = open(output, 'rb') if previous else None
+    try:
+        with open(spool_path, 'w+b') as spool:
+            def read_old(entry):
+                old_file.seek(entry.offset)
+                return old_file.read(entry.length)
+
+            def spool_block(uid, block, dtstart):
+                placed[uid] = (dtstart, spool, spool.tell(), len(block))
+                spool.write(block)
+
+            for event in events:
+                uid = str(event['uid'])
+                block = event.to_ical()
+                old = previous.get(uid)
+                if old is None:
+                    block = _with_revision(block, 0, dtstamp)
+                elif old.digest == hashlib.sha1(_stable(block)).digest() and old.status is None:
+                    placed[uid] = (old.dtstart, old_file, old.offset, old.length)
+                    continue
+                else:
+                    block = _with_revision(block, old.sequence + 1, dtstamp)
+                spool_block(uid, block, _prop(block, b'DTSTART') or '')
+
+            for uid, old in previous.items():
+                if uid in placed or old.dtstart[:8] < today:
+                    continue
+                if old.status == 'CANCELLED':
+                    placed[uid] = (old.dtstart, old_file, old.offset, old.length)
+                else:
+                    spool_block(uid, _with_revision(read_old(old), old.sequence + 1, dtstamp, 'CANCELLED'),
+                                old.dtstart)
+
+            # Sorting by start keeps inserts and removals local in the file's diff
+            with open(tmp_path, 'wb') as ics_file:
+                ics_file.write(header)
+                for uid in sorted(placed, key=lambda uid: (placed[uid][0], uid)):
+                    _, source, offset, length = placed[uid]
+                    source.seek(offset)
+                    ics_file.write(source.read(length))
+                ics_file.write(b'END:VCALENDAR\r\n')
+    finally:
+        if old_file:
+            old_file.close()
+        os.remove(spool_path)
+    os.replace(tmp_path, output)
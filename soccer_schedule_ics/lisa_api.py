@@ -0,0 +1,197 @@
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+from .metrics import METRICS
+from .payloads import WEEK_MAX, WEEK_MIN, build_payload, payload_key, request_body
+from .response_cache import CACHE_DIR, CacheMiss, ResponseCache
+from .singleflight import SingleFlight
+
+# API Endpoint (set LISA_BASE_URL to point the scripts at mock_server.py or another stand-in)
+BASE_URL = os.environ.get('LISA_BASE_URL', "https://lisa.gameschedule.ca").rstrip('/')
+URL = f"{BASE_URL}/GSServicePublic.asmx/LOAD_SchedulePublic"
+
+# Headers (Ensure they match what Chrome sent)
+HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "x-requested-with": "XMLHttpRequest",
+}
+
+MAX_WORKERS = 8            # Concurrent requests in flight
+REQUESTS_PER_SECOND = float(os.environ.get('LISA_RATE_LIMIT', 5))  # Per-host request rate (0 = unlimited)
+RETRIES = 3                # Retries on connection errors and 429/5xx
+BACKOFF_FACTOR = 0.5       # Sleeps 0.5s, 1s, 2s between retries
+
+_session = None
+_session_lock = threading.Lock()
+_cache = None
+_flights = SingleFlight('requests')  # Concurrent identical payloads share one POST
+
+
+class RateLimiter:
+    """Spaces requests to the same host at least 1/rate seconds apart"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_slot = {}
+        self.lock = threading.Lock()
+
+    def wait(self, url):
+        if not self.interval:
+            return
+        host = urlsplit(url).netloc
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_limiter = RateLimiter(REQUESTS_PER_SECOND)
+
+
+def get_session():
+    """Return the shared keep-alive session, creating it on first use"""
+    global _session
+    # requests is imported here, so runs answered from the cache never load it
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=RETRIES,
+                read=0,  # A read timeout means the server is still working on it; retrying only multiplies the wait
+                backoff_factor=BACKOFF_FACTOR,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=None,  # The schedule API is POST-only but idempotent
+            )
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS, max_retries=retry)
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+# ResponseCache options that can be set from the environment: (option, variable, scale)
+CACHE_ENV = (
+    ('current_ttl', 'LISA_CACHE_TTL', 1),             # Seconds, for week ranges with unplayed weeks
+    ('past_ttl', 'LISA_CACHE_PAST_TTL', 1),           # Seconds, for week ranges that have ended
+    ('max_bytes', 'LISA_CACHE_MAX_MB', 1024 * 1024),  # Size cap
+)
+
+
+def enable_cache(directory=CACHE_DIR, offline=None, **options):
+    """Cache responses on disk. In offline mode (or with LISA_OFFLINE=1), never touch the network.
+
+    Options not passed in are taken from CACHE_ENV's variables, else ResponseCache's defaults.
+    """
+    global _cache
+    if offline is None:
+        offline = os.environ.get('LISA_OFFLINE') == '1'
+    for option, variable, scale in CACHE_ENV:
+        if option not in options and os.environ.get(variable):
+            options[option] = float(os.environ[variable]) * scale
+    _cache = ResponseCache(directory, offline=offline, **options)
+    return _cache
+
+
+def parse_cache_args(parser=None, cache_by_default=False, argv=None):
+    """Parse the command line with --cache/--no-cache and --offline added, and enable the cache if asked to.
+
+    The discovery scripts cache by default, so reruns while hunting for IDs
+    don't hit the API again; the generator only does when asked.
+    """
+    parser = parser or argparse.ArgumentParser()
+    parser.add_argument('--cache', action=argparse.BooleanOptionalAction, default=cache_by_default,
+                        help=f"Reuse API responses cached in {CACHE_DIR} (TTLs and size cap from "
+                             f"{', '.join(variable for _, variable, _ in CACHE_ENV)})")
+    parser.add_argument('--offline', action='store_true',
+                        help="Serve API responses only from the cache (as does LISA_OFFLINE=1 when caching)")
+    args = parser.parse_args(argv)
+    if args.cache or args.offline:
+        enable_cache(offline=args.offline or None)
+    return args
+
+
+def post_schedule(payload, timeout=60):
+    """POST a payload to the schedule API and return p_Content (None if the response has none).
+
+    Callers asking for the same payload while it is in flight wait for that
+    request instead of sending their own.
+    """
+    return _flights.do(payload_key(payload), _post_schedule, payload, timeout)
+
+
+def _post_schedule(payload, timeout):
+    cache = _cache
+    if cache is not None:
+        key = cache.key(URL, payload)
+        hit, p_content = cache.get(key)
+        if hit:
+            METRICS.count('cache_hits')
+            return p_content
+        if cache.offline:
+            raise CacheMiss(f"❌ Offline and no cached response for competition {payload.get('strCompetition')}")
+
+    with METRICS.stage('rate_limit_wait'):
+        _limiter.wait(URL)
+    METRICS.count('requests')
+    try:
+        with METRICS.stage('request_wait'):
+            response = get_session().post(URL, data=request_body(payload), timeout=timeout)
+    except Exception:
+        METRICS.count('request_errors')
+        raise
+    METRICS.count('payload_bytes', len(response.content))
+
+    # Check API response
+    if response.status_code != 200:
+        METRICS.count('request_errors')
+        raise Exception(f"❌ Failed to fetch data. Status code: {response.status_code}\nResponse: {response.text}")
+
+    p_content = response.json().get('d', {}).get('p_Content', None)
+    if cache is not None:
+        cache.put(key, p_content, cache.ttl_for(payload))
+    return p_content
+
+
+def fetch_schedule(payload, timeout=60):
+    """Like post_schedule, but an empty schedule is an error"""
+    p_content = post_schedule(payload, timeout=timeout)
+    if not p_content:
+        raise Exception("❌ No content found in API response.")
+    return p_content
+
+
+def fetch_many(payloads, timeout=60, max_workers=MAX_WORKERS):
+    """Fetch many payloads concurrently.
+
+    Yields (index, p_content, error) tuples in completion order, where index is
+    the payload's position in the input and error is the exception if the fetch failed.
+    Payloads with the same payload_key are requested once and yielded for each index.
+    """
+    payloads = list(payloads)
+    positions = {}  # payload key -> indexes of the payloads asking for it
+    for i, payload in enumerate(payloads):
+        positions.setdefault(payload_key(payload), []).append(i)
+    if len(positions) < len(payloads):
+        METRICS.count('requests_deduplicated', len(payloads) - len(positions))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(post_schedule, payloads[indexes[0]], timeout): indexes
+                   for indexes in positions.values()}
+        for future in as_completed(futures):
+            try:
+                p_content, error = future.result(), None
+            except Exception as e:
+                p_content, error = None, e
+            for i in futures[future]:
+                yield i, p_content, error
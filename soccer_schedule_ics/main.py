@@ -0,0 +1,363 @@
+"""Generate ICS calendars from the LISA GameSchedule API.
+
+Runs start with a cheap check (fetch, fingerprint, compare with the last run)
+and most scheduled runs end there, so the parser, icalendar and the writer are
+imported inside the functions that use them rather than up front.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+from datetime import datetime, timedelta
+
+from .lisa_api import WEEK_MIN, WEEK_MAX, build_payload, parse_cache_args
+from .exhibition import EXHIBITION_FILE, load_exhibition_games, merge_exhibition, sheet_hash
+from .metrics import METRICS
+from .models import REGISTRY, format_time
+from .refresh_state import UNCHANGED_EXIT_CODE, combine, fingerprint, load_state, save_state
+from .season import MONTH_NAMES, TIMEZONE, fetch_windows, local_datetime, split_payload
+
+# Per-game progress lines are only printed with -v; they cost real I/O on large runs
+VERBOSE = False
+
+# The calendar generate_ics() builds when no batch config is given
+DEFAULT_TEAM = 841
+DEFAULT_OUTPUT = 'soccer_schedule.ics'
+
+
+def new_calendar(calendar_name, calendar_desc):
+    """An empty Calendar with the feed's name and description"""
+    from icalendar import Calendar
+
+    calendar = Calendar()
+    calendar.add('prodid', 'ics.py - http://git.io/lLljaA')
+    calendar.add('version', '2.0')
+    calendar.add('calscale', 'GREGORIAN')
+    calendar.add('x-wr-calname', calendar_name)
+    calendar.add('x-wr-caldesc', calendar_desc)
+    calendar.add('x-wr-timezone', 'America/Los_Angeles')
+    return calendar
+
+
+def build_events(games, now=None):
+    """Yield an icalendar Event for each playable Game.
+
+    now decides which TBD games are close enough to list; pass the run's
+    single now so every calendar in a batch agrees.
+    """
+    from icalendar import Event, vDate, vDatetime
+    from .ics_writer import GameUids
+
+    now = now or datetime.now(TIMEZONE)
+    tbd_until = now + timedelta(days=6)
+    game_uid = GameUids()
+
+    for game in games:
+        try:
+            event_year, month, day = game.year, game.month, game.day
+            month_str = MONTH_NAMES[month - 1]
+
+            # Skip BYE games
+            if game.is_bye:
+                METRICS.count('rows_skipped_bye')
+                if VERBOSE:
+                    print(f"Skipping BYE game on {month_str} {day}, {event_year}")
+                continue
+
+            home_team = game.home.name
+            guest_team = game.away.name
+            if VERBOSE:
+                print(f"Processing: {home_team} vs {guest_team} on {month_str} {day}, {event_year} at {format_time(game.time)}")
+            uid = game_uid(event_year, month, day, game.home.key, game.away.key)
+
+            if game.time is None:
+                event_date = local_datetime(game.date)
+                if now <= event_date <= tbd_until:
+                    event = Event()
+                    event.add('uid', uid)
+                    event.add('summary', f"{home_team} vs {guest_team} (TBD)")
+                    event.add('dtstart', vDate(event_date.date()))
+                    event.add('location', home_team)
+                    event.add('description', f"Home: {home_team}, Guest: {guest_team}. Time TBD.")
+                    METRICS.count('events_created')
+                    yield event
+                else:
+                    METRICS.count('rows_skipped_tbd')
+                continue
+
+            event_date = local_datetime(game.date, game.time)
+            end_date = event_date + timedelta(hours=2)
+
+            event = Event()
+            event.add('uid', uid)
+            event.add('summary', f"{home_team} vs {guest_team}")
+            event.add('dtstart', vDatetime(event_date))
+            event.add('dtend', vDatetime(end_date))
+            event.add('location', game.field or "No Field Assigned")
+            event.add('description', f"Home: {home_team}, Guest: {guest_team}")
+
+        except Exception as e:
+            METRICS.count('rows_errored')
+            print(f"❌ Error processing game: {e}")
+            continue
+
+        METRICS.count('events_created')
+        yield event
+
+
+def stream_calendar(games, calendar_name, calendar_desc, output, now=None):
+    """Write games straight to an .ics file, one VEVENT at a time, without building a Calendar.
+
+    games can be a lazy iterator (e.g. REGISTRY.games(iter_schedule(...))), so
+    parsing, event building and writing all happen in one pass with flat memory use.
+    Event building (including turning rows into Games) is timed as its own stage.
+    """
+    from .ics_writer import calendar_header, write_events
+
+    header = calendar_header(new_calendar(calendar_name, calendar_desc))
+    with METRICS.stage('write'):
+        write_events(header, METRICS.timed('build_events', build_events(games, now)), output, now)
+
+    print(f"✅ Calendar successfully generated: {output}")
+
+
+class DivisionsFailed(Exception):
+    """Raised by generate_batch after the rest of the batch is done, when some divisions couldn't be fetched"""
+
+    def __init__(self, failed):
+        self.failed = failed  # Division -> error
+        super().__init__(f"{len(failed)} division(s) could not be fetched: {', '.join(map(str, failed))}")
+
+
+def is_unchanged(state, hashes):
+    """True if every output exists and was last built from content with its hash (output -> hash)"""
+    return all(state.get(output) == content_hash and os.path.exists(output) for output, content_hash in hashes.items())
+
+
+def archive_games(path, key, games, version):
+    """Record a parsed schedule's games in the history archive (see archive.py)"""
+    from .archive import connect, record
+
+    conn = connect(path)
+    try:
+        changed = record(conn, key, games, version)
+    finally:
+        conn.close()
+    if changed:
+        print(f"🗂️  Archived {changed} changed games for {key}")
+
+
+def load_exhibition(path=EXHIBITION_FILE):
+    """Exhibition games and the sheet's hash, saying so when there is no sheet"""
+    exhibition_games, exhibition_hash = load_exhibition_games(path)
+    if exhibition_hash is None:
+        print("No exhibition games found. Skipping.")
+    return exhibition_games, exhibition_hash
+
+
+def generate_ics(force=False, chunk_weeks=None, archive=None):
+    """Generate soccer_schedule.ics. Returns False if the schedule hadn't changed.
+
+    With chunk_weeks, the season is fetched as concurrent windows of that many
+    weeks, skipping windows that are already over. With archive (a path), the
+    parsed games are also recorded in that history archive.
+    """
+    now = datetime.now(TIMEZONE)  # One "now" for the whole run
+
+    # 🔹 Updated Payload for U16 Boys Division 2 (Tier 3)
+    payload = build_payload("12", 161, DEFAULT_TEAM)  # Competition 12 for U16
+    output = DEFAULT_OUTPUT
+
+    payloads = split_payload(payload, chunk_weeks, skip_past=True)
+    ((_, p_content, rows, error),) = fetch_windows({output: payloads})
+    if error:
+        raise error
+    state = load_state()
+    schedule_hash = fingerprint(p_content)
+    content_hash = combine(schedule_hash, sheet_hash())
+    if not force and is_unchanged(state, {output: content_hash}):
+        print(f"⏭️  Schedule unchanged, keeping {output}")
+        return False
+
+    from .schedule_parser import iter_schedule
+
+    # Load exhibition games
+    exhibition_games, _ = load_exhibition()
+    if rows is None:
+        rows = METRICS.timed('parse', iter_schedule(p_content))  # Parsed as the calendar is written
+    games = REGISTRY.games(rows, payload['strWeekMin'], payload['strWeekMax'])
+    if archive:
+        games = list(games)
+        archive_games(archive, f"12|161|{DEFAULT_TEAM}", games, schedule_hash)
+    games = merge_exhibition(games, exhibition_games)
+    stream_calendar(games, 'Lakehill U16 Div 2 (T3) Schedule',
+                    'Event schedule for Lakehill U16 Division 2 (Tier 3)', output, now)
+
+    state[output] = content_hash
+    save_state(state)
+    return True
+
+
+def load_targets(config_path):
+    """Read a batch config file and group its targets and feeds by (competition, division)"""
+    with open(config_path, mode='r') as config_file:
+        config = json.load(config_file)
+
+    week_min = config.get('week_min', WEEK_MIN)
+    week_max = config.get('week_max', WEEK_MAX)
+    groups = {}
+    for target in config.get('targets', []) + config.get('feeds', []):
+        key = (str(target['competition']), str(target['division']))
+        groups.setdefault(key, []).append(target)
+    return groups, week_min, week_max, config.get('chunk_weeks')
+
+
+def generate_batch(config_path, force=False, chunk_weeks=None, workers=1, snapshots=None, archive=None):
+    """Generate one calendar per target or feed, fetching and parsing each division only once.
+
+    Every target is a FeedQuery over its division's Snapshot ('team' is a
+    one-team query). Targets with the same query, sheet and names are rendered
+    once and copied. With workers > 1, large responses are parsed and the
+    calendars written in that many processes (for league-wide configs); the
+    output is the same. If snapshots is a dict, each division's Snapshot is
+    kept there by (competition, division), and one that is still current is
+    reused instead of parsing again. With archive (a path), each parsed
+    division is recorded in that history archive. Returns False if nothing had changed.
+
+    A division whose fetch fails is skipped so the others still get built;
+    DivisionsFailed is raised at the end (after saving the others' state).
+    """
+    from .parse_pool import make_pool, parse_parallel, write_calendars
+    from .schedule_parser import iter_schedule
+    from .views import FeedQuery, Snapshot, filter_feed
+
+    groups, week_min, week_max, config_chunk_weeks = load_targets(config_path)
+    chunk_weeks = chunk_weeks or config_chunk_weeks
+    state = load_state()
+    now = datetime.now(TIMEZONE)  # One "now" for the whole run
+
+    division_payloads = {
+        key: split_payload(build_payload(key[0], key[1], -1, week_min=week_min, week_max=week_max),
+                           chunk_weeks, skip_past=True)
+        for key in groups
+    }
+
+    changed = False
+    failed = {}
+    with make_pool(workers, VERBOSE) as pool:
+        # Fetch every division concurrently, building calendars as responses arrive
+        for (competition, division), p_content, rows, error in fetch_windows(division_payloads):
+            key = (competition, division)
+            targets = groups[key]
+            if error:
+                print(f"❌ Skipping division {division}: {error}")
+                failed[division] = error
+                continue
+            content_hash = fingerprint(p_content)
+            queries = {target['output']: FeedQuery.from_params(target) for target in targets}
+            # A target can list its team's exhibition games in its own sheet
+            hashes = {target['output']: combine(content_hash, sheet_hash(target['exhibition'])
+                                                if target.get('exhibition') else None,
+                                                queries[target['output']].key())
+                      for target in targets}
+            snapshot = snapshots.get(key) if snapshots is not None else None
+            if snapshot is not None and snapshot.version != content_hash:
+                snapshot = None
+            if not force and is_unchanged(state, hashes) and (snapshots is None or snapshot is not None):
+                print(f"⏭️  Division {division} unchanged, skipping {len(targets)} calendars")
+                continue
+            print(f"Fetched competition {competition}, division {division} ({len(targets)} calendars)")
+            if snapshot is None:
+                with METRICS.stage('parse'):
+                    if rows is None:
+                        rows = parse_parallel(p_content, pool, workers) if pool else iter_schedule(p_content)
+                    # The raw rows are dropped as soon as their Games exist
+                    snapshot = Snapshot(key, content_hash, REGISTRY.games(rows, week_min, week_max))
+                rows = None
+                if snapshots is not None:
+                    snapshots[key] = snapshot
+                if archive:
+                    archive_games(archive, f"{competition}|{division}|-1", snapshot.games, content_hash)
+
+            jobs = []
+            copies = []
+            rendered = {}  # (query, sheet, name, desc) -> the output it was rendered to
+            for target in targets:
+                query = queries[target['output']]
+                calendar_name = target['calendar_name']
+                calendar_desc = target.get('calendar_desc', f"Event schedule for {calendar_name}")
+                feed_key = (query, target.get('exhibition'), calendar_name, calendar_desc)
+                if feed_key in rendered:
+                    copies.append((rendered[feed_key], target['output']))
+                    continue
+                rendered[feed_key] = target['output']
+                exhibition_games = load_exhibition(target['exhibition'])[0] if target.get('exhibition') else []
+                feed_games = filter_feed(merge_exhibition(snapshot.team_games(query), exhibition_games), query)
+                jobs.append((list(feed_games) if pool else feed_games, calendar_name, calendar_desc,
+                             target['output'], now))
+            if pool:
+                write_calendars(pool, jobs)
+            else:
+                for job in jobs:
+                    stream_calendar(*job)
+            for source, output in copies:
+                shutil.copyfile(source, output)
+                METRICS.count('feeds_reused')
+                print(f"✅ Calendar successfully generated: {output} (same feed as {source})")
+            for target in targets:
+                state[target['output']] = hashes[target['output']]
+            changed = True
+
+    save_state(state)
+    if failed:
+        raise DivisionsFailed(failed)
+    return changed
+
+
+def main(argv=None):
+    """Command-line entry point (also installed as the soccer-schedule-ics script)"""
+    global VERBOSE
+    parser = argparse.ArgumentParser(description="Generate ICS calendars from the LISA GameSchedule API")
+    parser.add_argument('--config', help="JSON file listing many team targets to generate in one batch")
+    parser.add_argument('--force', action='store_true', help="Regenerate even if the schedule hasn't changed")
+    parser.add_argument('--chunk-weeks', type=int,
+                        help="Fetch the season as concurrent windows of this many weeks, skipping finished ones")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Processes for parsing and writing a batch (0 = one per CPU); for league-wide configs")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Print a line for every game processed")
+    parser.add_argument('--metrics-json', metavar='FILE',
+                        help="Append this run's stage timings and counters as a JSON line ('-' for stdout)")
+    parser.add_argument('--metrics-prom', metavar='FILE', help="Write metrics in Prometheus text format")
+    parser.add_argument('--archive', nargs='?', const='schedule_archive.db', metavar='DB',
+                        help="Record each parsed schedule in a history archive (see archive.py)")
+    args = parse_cache_args(parser, argv=argv)
+
+    VERBOSE = args.verbose
+    changed = None
+    try:
+        if args.config:
+            from .parse_pool import default_workers
+
+            changed = generate_batch(args.config, force=args.force, chunk_weeks=args.chunk_weeks,
+                                     workers=args.workers or default_workers(), archive=args.archive)
+        else:
+            changed = generate_ics(force=args.force, chunk_weeks=args.chunk_weeks, archive=args.archive)
+    except DivisionsFailed as e:
+        print(f"❌ {e}")  # Never reported as unchanged: the failed divisions' calendars are stale
+    finally:
+        METRICS.count('runs_changed' if changed else 'runs_unchanged' if changed is False else 'runs_failed')
+        if args.metrics_json == '-':
+            print(json.dumps(METRICS.snapshot()))
+        elif args.metrics_json:
+            METRICS.write_json(args.metrics_json)
+        if args.metrics_prom:
+            METRICS.write_prometheus(args.metrics_prom)
+    if changed is None:
+        sys.exit(1)
+    if not changed:
+        sys.exit(UNCHANGED_EXIT_CODE)
+
+
+if __name__ == "__main__":
+    main()
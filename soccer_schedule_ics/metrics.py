@@ -0,0 +1,131 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+PROMETHEUS_PREFIX = "soccer_ics"
+
+
+class Metrics:
+    """Thread-safe stage timings and counters for one generator run.
+
+    Stage timings are summed over every time the stage ran (e.g. across
+    concurrent requests), alongside how many times it ran. Time spent in a
+    stage nested inside another (on the same thread) only counts for the inner one.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.nested = threading.local()  # .seconds: time taken by stages inside the current one
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started = time.time()
+            self.stage_seconds = {}
+            self.stage_counts = {}
+            self.counters = {}
+
+    def _enter(self):
+        outer = getattr(self.nested, 'seconds', 0.0)
+        self.nested.seconds = 0.0
+        return outer, time.perf_counter()
+
+    def _exit(self, outer, start):
+        """Seconds spent since _enter, less any nested stages'"""
+        elapsed = time.perf_counter() - start
+        own = elapsed - self.nested.seconds
+        self.nested.seconds = outer + elapsed
+        return own
+
+    @contextmanager
+    def stage(self, name):
+        outer, start = self._enter()
+        try:
+            yield
+        finally:
+            self.observe(name, self._exit(outer, start))
+
+    def timed(self, name, iterable):
+        """Yield iterable's items, timing the work of producing them as one run of stage name.
+
+        For lazy pipelines (parse -> build events -> write) whose stages run
+        interleaved, a row at a time: each gets only its own share of the time.
+        """
+        iterator = iter(iterable)
+        seconds = 0.0
+        try:
+            while True:
+                outer, start = self._enter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    seconds += self._exit(outer, start)
+                yield item
+        finally:
+            self.observe(name, seconds)
+
+    def observe(self, name, seconds):
+        with self.lock:
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + seconds
+            self.stage_counts[name] = self.stage_counts.get(name, 0) + 1
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def merge(self, snapshot):
+        """Add another run's snapshot() (e.g. a worker process's) into this one"""
+        with self.lock:
+            for name, stage in snapshot['stages'].items():
+                self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + stage['seconds']
+                self.stage_counts[name] = self.stage_counts.get(name, 0) + stage['count']
+            for name, value in snapshot['counters'].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                'wall_seconds': round(time.time() - self.started, 4),
+                'stages': {
+                    name: {'seconds': round(seconds, 4), 'count': self.stage_counts[name]}
+                    for name, seconds in sorted(self.stage_seconds.items())
+                },
+                'counters': dict(sorted(self.counters.items())),
+            }
+
+    def write_json(self, path, **fields):
+        """Append this run's metrics as one JSON line (extra fields are included as-is)"""
+        record = dict(fields, **self.snapshot())
+        with open(path, 'a') as log_file:
+            log_file.write(json.dumps(record) + "\n")
+
+    def write_prometheus(self, path):
+        """Write metrics in Prometheus text format (for node_exporter's textfile collector)"""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {PROMETHEUS_PREFIX}_stage_seconds Time spent in each generator stage",
+            f"# TYPE {PROMETHEUS_PREFIX}_stage_seconds summary",
+        ]
+        for name, stage in snapshot['stages'].items():
+            lines.append(f'{PROMETHEUS_PREFIX}_stage_seconds_sum{{stage="{name}"}} {stage["seconds"]}')
+            lines.append(f'{PROMETHEUS_PREFIX}_stage_seconds_count{{stage="{name}"}} {stage["count"]}')
+        for name, value in snapshot['counters'].items():
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}_{name}_total counter")
+            lines.append(f"{PROMETHEUS_PREFIX}_{name}_total {value}")
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_run_seconds gauge")
+        lines.append(f"{PROMETHEUS_PREFIX}_run_seconds {snapshot['wall_seconds']}")
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as prom_file:
+            prom_file.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+
+
+# Shared registry the fetch layer and generator record into
+METRICS = Metrics()
@@ -0,0 +1,170 @@
+"""Compact typed records for the games that flow from the parser to the ICS writer.
+
+ScheduleRow (schedule_parser) is the raw text of one Schedule_Row. Game is what
+the rest of the pipeline works with: the date and time are ints, and teams,
+divisions and fields are interned through a Registry, so a league-wide pull
+holds one Team object per team rather than a copy of its strings per game.
+"""
+import sys
+from datetime import date
+from functools import lru_cache
+
+from .lisa_api import WEEK_MAX, WEEK_MIN
+from .metrics import METRICS
+from .season import resolve_date
+
+
+class Division:
+    __slots__ = ('name', 'id')
+
+    def __init__(self, name, division_id=None):
+        self.name = name
+        self.id = division_id
+
+    def __repr__(self):
+        return f"Division({self.name!r}, {self.id!r})"
+
+
+class Team:
+    __slots__ = ('id', 'name', 'division')
+
+    def __init__(self, team_id, name, division=None):
+        self.id = team_id            # int from PAGE_LoadTeam(...), or None (e.g. exhibition opponents)
+        self.name = name
+        self.division = division     # Division or None
+
+    @property
+    def key(self):
+        """What identifies the team in UIDs: its ID where known, else its name"""
+        return self.id if self.id is not None else self.name
+
+    def __repr__(self):
+        return f"Team({self.id!r}, {self.name!r})"
+
+
+class Game:
+    __slots__ = ('date', 'time', 'home', 'away', 'field')
+
+    def __init__(self, game_date, game_time, home, away, field=None):
+        self.date = game_date        # YYYYMMDD int
+        self.time = game_time        # Minutes after midnight, or None when TBD
+        self.home = home             # Team, or None for a BYE
+        self.away = away
+        self.field = field           # Interned field name or None
+
+    @property
+    def year(self):
+        return self.date // 10000
+
+    @property
+    def month(self):
+        return self.date // 100 % 100
+
+    @property
+    def day(self):
+        return self.date % 100
+
+    @property
+    def is_bye(self):
+        return self.home is None or self.away is None
+
+    def __repr__(self):
+        return f"Game({self.date}, {self.time}, {self.home!r}, {self.away!r}, {self.field!r})"
+
+
+@lru_cache(maxsize=1024)
+def parse_time(time_str):
+    """'2:30 PM' -> 870 (minutes after midnight); None for TBD or a missing time"""
+    if not time_str or time_str == "TBD":
+        return None
+    clock, meridiem = time_str.split()
+    hour, minute = (int(part) for part in clock.split(':'))
+    meridiem = meridiem.upper()
+    if not (1 <= hour <= 12 and 0 <= minute <= 59 and meridiem in ('AM', 'PM')):
+        raise ValueError(f"Bad time: {time_str!r}")
+    return (hour % 12 + (12 if meridiem == 'PM' else 0)) * 60 + minute
+
+
+def format_time(minutes):
+    """870 -> '2:30 PM'; None -> 'TBD'"""
+    if minutes is None:
+        return "TBD"
+    hour, minute = divmod(minutes, 60)
+    return f"{hour % 12 or 12}:{minute:02d} {'PM' if hour >= 12 else 'AM'}"
+
+
+def date_int(year, month, day):
+    date(year, month, day)  # Reject impossible dates up front
+    return year * 10000 + month * 100 + day
+
+
+class Registry:
+    """Interns teams, divisions and field names so every Game shares the same objects"""
+
+    def __init__(self):
+        self.teams = {}
+        self.divisions = {}
+        self.fields = {}
+
+    def division(self, name, division_id=None):
+        if not name:
+            return None
+        division = self.divisions.get(name)
+        if division is None:
+            division = self.divisions[name] = Division(sys.intern(name), division_id)
+        elif division.id is None:
+            division.id = division_id
+        return division
+
+    def team(self, team_id, name, division_name=None):
+        """The Team for an ID (or, without one, a name), or None for a BYE ('--')"""
+        if not name or name == "--":
+            return None
+        team_id = int(team_id) if team_id else None
+        key = team_id if team_id is not None else name
+        team = self.teams.get(key)
+        if team is None:
+            team = self.teams[key] = Team(team_id, sys.intern(name), self.division(division_name))
+        elif team.division is None and division_name:
+            team.division = self.division(division_name)
+        return team
+
+    def field(self, name):
+        if not name:
+            return None
+        return self.fields.setdefault(name, sys.intern(name))
+
+    def game_from_row(self, row, week_min=WEEK_MIN, week_max=WEEK_MAX):
+        year, month, day = resolve_date(row.date_text, week_min, week_max)
+        home = self.team(row.home_id, row.home_team, row.home_division)
+        away = self.team(row.away_id, row.guest_team, row.away_division)
+        game_time = parse_time(row.time_str) if home and away else None  # BYE rows' times don't matter
+        return Game(date_int(year, month, day), game_time, home, away, self.field(row.field))
+
+    def exhibition_game(self, date_str, time_str, home_team, guest_team, field=None):
+        """A Game from an exhibition.csv row ('2024-11-02', '2:30 PM', home, guest, field)"""
+        game_date = date.fromisoformat(date_str.strip())
+        return Game(date_int(game_date.year, game_date.month, game_date.day), parse_time(time_str.strip()),
+                    self.team(None, home_team.strip()), self.team(None, guest_team.strip()),
+                    self.field(field.strip() if field else None))
+
+    def games(self, rows, week_min=WEEK_MIN, week_max=WEEK_MAX):
+        """Yield a Game per ScheduleRow, counting and reporting rows that can't be read.
+
+        week_min/week_max are the strWeekMin/strWeekMax the rows were fetched
+        with; they decide which year each date falls in. rows can be a lazy
+        iterator, so each row can be freed as soon as its Game exists.
+        """
+        for row in rows:
+            METRICS.count('rows_processed')
+            try:
+                game = self.game_from_row(row, week_min, week_max)
+            except (AttributeError, KeyError, ValueError) as e:
+                METRICS.count('rows_errored')
+                print(f"❌ Error processing game: {e}")
+                continue
+            yield game
+
+
+# Shared registry, so repeated fetches in one process reuse the same Team objects
+REGISTRY = Registry()
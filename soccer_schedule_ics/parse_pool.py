@@ -0,0 +1,87 @@
+"""Spread parsing and calendar writing over worker processes for league-wide exports.
+
+p_Content is cut on Schedule_Row boundaries, so each worker parses an
+independent slice and the rows come back in document order. Each target's
+calendar is its own file, so calendars are written one per worker task.
+Results are identical to the single-process path, just spread over cores.
+
+Workers are started with forkserver (spawn where that isn't available), not
+fork: the pool starts while fetch threads may hold locks, which a forked child
+would inherit locked.
+"""
+import os
+import re
+from contextlib import nullcontext
+
+from .metrics import METRICS
+from .schedule_parser import parse_schedule
+
+ROW_START_RE = re.compile(r'<div\s[^>]*?class="Schedule_Row[\s"]')
+MIN_SLICE_CHARS = 256 * 1024  # Below this, shipping a slice to a worker costs more than parsing it
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def split_rows(p_content, parts):
+    """Cut p_Content into at most parts slices, each after the first starting at a Schedule_Row"""
+    if parts <= 1 or len(p_content) < 2 * MIN_SLICE_CHARS:
+        return [p_content]
+    size = max(len(p_content) // parts, MIN_SLICE_CHARS)
+    cuts = [0]
+    while True:
+        match = ROW_START_RE.search(p_content, cuts[-1] + size)
+        if not match:
+            break
+        cuts.append(match.start())
+    cuts.append(len(p_content))
+    return [p_content[start:end] for start, end in zip(cuts, cuts[1:])]
+
+
+def parse_parallel(p_content, executor, workers):
+    """parse_schedule(p_content), with the slices parsed concurrently in executor"""
+    slices = split_rows(p_content, workers)
+    if len(slices) == 1:
+        return parse_schedule(p_content)
+    rows = []
+    for part in executor.map(parse_schedule, slices):  # map keeps slice order
+        rows.extend(part)
+    return rows
+
+
+def _init_worker(verbose):
+    from . import main
+
+    main.VERBOSE = verbose
+
+
+def _write_calendar(games, calendar_name, calendar_desc, output, now):
+    from .main import stream_calendar
+
+    METRICS.reset()
+    stream_calendar(games, calendar_name, calendar_desc, output, now)
+    return METRICS.snapshot()
+
+
+def write_calendars(executor, jobs):
+    """Run stream_calendar(*job) for each job in executor, folding the workers' stages and counters into METRICS.
+
+    Each job is (games, calendar_name, calendar_desc, output, now); games must
+    be a list, since it is pickled to the worker.
+    """
+    futures = [executor.submit(_write_calendar, *job) for job in jobs]
+    for future in futures:
+        METRICS.merge(future.result())
+
+
+def make_pool(workers, verbose=False):
+    """A process pool for workers > 1, else a context that yields None (callers then stay in-process)"""
+    if workers <= 1:
+        return nullcontext()
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method),
+                               initializer=_init_worker, initargs=(verbose,))
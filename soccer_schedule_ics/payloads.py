@@ -0,0 +1,78 @@
+"""Compact, canonical LOAD_SchedulePublic payloads.
+
+The filter XML is serialized without whitespace, in one fixed filter order:
+
+    <FILTERS><DATERANGE><NAME>DATERANGE</NAME><VALUE>-1</VALUE></DATERANGE><CLUB>...</FILTERS>
+
+Filter strings and request bodies are memoized by value, so scanning hundreds
+of division IDs formats each distinct filter set once. payload_key() gives
+every payload a canonical identity (however its XML was spelled), which the
+response cache keys on and fetch_many uses to send identical requests once.
+"""
+import json
+import re
+from functools import lru_cache
+
+# Default season range
+WEEK_MIN = "2025|8|18:2025|8|24"
+WEEK_MAX = "2026|3|16:2026|3|22"
+
+FILTERS = ('DATERANGE', 'CLUB', 'DIVISION', 'TEAM', 'FIELD', 'GAMES')  # The order the site sends them in
+
+_PAYLOAD_FIELDS = {'strCompetition', 'strFiltersXML', 'strWeekMin', 'strWeekMax'}
+_FILTER_RE = re.compile(r'<NAME>\s*(.*?)\s*</NAME>\s*<VALUE>\s*(.*?)\s*</VALUE>', re.S)
+
+
+def _escape(value):
+    return str(value).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _serialize(filters):
+    """[(name, value), ...] -> compact <FILTERS> XML"""
+    return '<FILTERS>' + ''.join(f'<{name}><NAME>{name}</NAME><VALUE>{value}</VALUE></{name}>'
+                                 for name, value in filters) + '</FILTERS>'
+
+
+@lru_cache(maxsize=4096)
+def filters_xml(daterange=-1, club=-1, division=-1, team=-1, field=-1, games="UNPLAYED"):
+    """strFiltersXML for one set of filter values (-1 means any)"""
+    return _serialize(zip(FILTERS, (_escape(value) for value in (daterange, club, division, team, field, games))))
+
+
+@lru_cache(maxsize=4096)
+def canonical_filters(filters):
+    """Any spelling of a strFiltersXML (indented, reordered) -> the compact form filters_xml produces"""
+    values = dict(_FILTER_RE.findall(filters))
+    order = [name for name in FILTERS if name in values] + sorted(set(values) - set(FILTERS))
+    return _serialize((name, values[name]) for name in order)
+
+
+def build_payload(competition, division=-1, team=-1, games="UNPLAYED", week_min=WEEK_MIN, week_max=WEEK_MAX,
+                  daterange=-1, club=-1, field=-1):
+    """Build a LOAD_SchedulePublic payload for one competition/division/team"""
+    return {
+        "strCompetition": str(competition),
+        "strFiltersXML": filters_xml(daterange, club, division, team, field, games),
+        "strWeekMax": week_max,
+        "strWeekMin": week_min,
+    }
+
+
+def payload_key(payload):
+    """(competition, canonical filters, week_min, week_max): equal for payloads that ask for the same thing"""
+    return (str(payload.get('strCompetition', '')), canonical_filters(payload.get('strFiltersXML', '')),
+            payload.get('strWeekMin', ''), payload.get('strWeekMax', ''))
+
+
+@lru_cache(maxsize=4096)
+def _body(key):
+    competition, filters, week_min, week_max = key
+    return json.dumps({"strCompetition": competition, "strFiltersXML": filters,
+                       "strWeekMax": week_max, "strWeekMin": week_min}, separators=(',', ':')).encode('utf-8')
+
+
+def request_body(payload):
+    """The JSON request body for payload, serialized once per distinct payload"""
+    if not set(payload) <= _PAYLOAD_FIELDS:  # Fields this module doesn't know about are sent as given
+        return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return _body(payload_key(payload))
@@ -0,0 +1,50 @@
+import hashlib
+import json
+import os
+import re
+from datetime import date
+
+STATE_FILE = '.schedule_state.json'
+
+# Exit status main.py uses when nothing changed, so the workflow can skip publishing
+UNCHANGED_EXIT_CODE = 3
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def fingerprint(p_content, today=None):
+    """Hash of the schedule HTML with whitespace normalized.
+
+    Today's date is mixed in because TBD games only appear once they are within
+    six days, so the calendar still gets rebuilt at least once a day.
+    """
+    today = today or date.today()
+    normalized = _WHITESPACE_RE.sub(' ', p_content).strip()
+    digest = hashlib.sha256(today.isoformat().encode())
+    digest.update(normalized.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def combine(content_hash, *extras):
+    """Fold extra inputs (e.g. an exhibition sheet's hash) into a schedule fingerprint"""
+    extras = [extra for extra in extras if extra]
+    if not extras:
+        return content_hash
+    return hashlib.sha256("|".join([content_hash] + extras).encode()).hexdigest()
+
+
+def load_state(path=STATE_FILE):
+    """Read the saved fingerprints (key -> hash), or {} if there are none yet"""
+    try:
+        with open(path, mode='r') as state_file:
+            return json.load(state_file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_state(state, path=STATE_FILE):
+    """Write the fingerprints atomically so an interrupted run can't corrupt them"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, mode='w') as state_file:
+        json.dump(state, state_file, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import date
+
+from .payloads import payload_key
+
+CACHE_DIR = '.lisa_cache'
+MAX_BYTES = 200 * 1024 * 1024   # Evict least recently used entries beyond this
+PAST_TTL = 30 * 24 * 3600       # Week ranges that have fully ended rarely change
+CURRENT_TTL = 15 * 60           # Ranges with unplayed weeks can change any time
+
+_DATERANGE_RE = re.compile(r'<DATERANGE>.*?<VALUE>(.*?)</VALUE>', re.S)
+
+
+class CacheMiss(Exception):
+    """Raised in offline mode when a payload has never been cached"""
+
+
+def _range_end(week_range):
+    """End date of a 'Y|M|D:Y|M|D' week range, or None if it isn't one"""
+    try:
+        year, month, day = (int(part) for part in week_range.split(':')[-1].split('|'))
+        return date(year, month, day)
+    except (AttributeError, ValueError):
+        return None
+
+
+class ResponseCache:
+    """On-disk cache of p_Content keyed by the request payload"""
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=MAX_BYTES, past_ttl=PAST_TTL, current_ttl=CURRENT_TTL,
+                 offline=False):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.past_ttl = past_ttl
+        self.current_ttl = current_ttl
+        self.offline = offline
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, url, payload):
+        """Stable hash of (URL, competition, canonical filters, week range)"""
+        parts = [url, *payload_key(payload)]
+        return hashlib.sha256(json.dumps(parts).encode('utf-8')).hexdigest()
+
+    def ttl_for(self, payload):
+        """Long TTL once every requested week is in the past, short otherwise"""
+        match = _DATERANGE_RE.search(payload.get('strFiltersXML', ''))
+        end = _range_end(match.group(1)) if match else None
+        if end is None:
+            end = _range_end(payload.get('strWeekMax'))
+        if end is not None and end < date.today():
+            return self.past_ttl
+        return self.current_ttl
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        """Return (hit, p_content). Offline mode also serves expired entries."""
+        path = self._path(key)
+        try:
+            with open(path, mode='r', encoding='utf-8') as entry_file:
+                entry = json.load(entry_file)
+        except (FileNotFoundError, ValueError):
+            return False, None
+        if not self.offline and entry['expires'] < time.time():
+            return False, None
+        try:
+            os.utime(path)  # mtime doubles as the LRU timestamp
+        except FileNotFoundError:
+            pass
+        return True, entry['p_content']
+
+    def put(self, key, p_content, ttl):
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, mode='w', encoding='utf-8') as entry_file:
+            json.dump({'expires': time.time() + ttl, 'p_content': p_content}, entry_file)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        with self.lock:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.json'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+            if total <= self.max_bytes:
+                return
+            for _, size, path in sorted(entries):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                total -= size
+                if total <= self.max_bytes:
+                    break
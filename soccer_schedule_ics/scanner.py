@@ -0,0 +1,95 @@
+"""Adaptive division ID scanning shared by the find_* scripts.
+
+Instead of probing every ID in fixed blocks, each seed range is walked a few
+IDs at a time and dropped once EMPTY_GAP consecutive IDs come back empty,
+while every hit widens the search around it.
+
+Every batch of probe outcomes is saved to the discovery index's probes table
+(see discover.py), the same record `discover.py crawl` keeps. A scan that is
+interrupted or ends with failed probes picks up where it stopped on the next
+run: IDs found empty in the last EMPTY_RECHECK_DAYS are not probed again, and
+failed ones are retried.
+"""
+import time
+
+from .discover import EMPTY_RECHECK_DAYS, probe_states, record_probes
+from .lisa_api import fetch_many
+from .schedule_parser import parse_schedule
+
+EMPTY_GAP = 10  # Consecutive empty IDs that end a range
+
+
+def known_empty(conn, scope, max_age_days=EMPTY_RECHECK_DAYS):
+    """IDs probed empty under scope in the last max_age_days, saying so when it resumes an earlier scan"""
+    states = probe_states(conn, scope)
+    cutoff = time.time() - max_age_days * 86400
+    empty = {div_id for div_id, (status, probed_at) in states.items() if status == 'empty' and probed_at >= cutoff}
+    failed = sum(1 for status, _ in states.values() if status == 'error')
+    if empty or failed:
+        print(f"↩️  Skipping {len(empty)} IDs already found empty; retrying {failed} that failed last time")
+    return empty
+
+
+def scan_divisions(conn, scope, seed_ranges, make_payload, gap=EMPTY_GAP, timeout=5, min_content=100):
+    """Find the live division IDs in and around seed_ranges.
+
+    conn is the discovery index (discover.open_index). make_payload(division_id)
+    builds the request for one ID. scope names the competition/week filters the
+    payloads use, so probes from one query are not reused for another.
+
+    Each batch's outcomes are saved to the probes table as it completes, and
+    IDs recently found empty are skipped. Live IDs are fetched again for their
+    rows (the find_* scripts enable the response cache, so that costs no
+    upstream request), and failed ones are retried.
+
+    Returns (live, errors, probes): live maps division ID -> parsed rows,
+    errors maps division ID -> the exception for probes that failed rather
+    than came back empty, probes is how many requests were sent.
+    """
+    cursors = [[low, high] for low, high in seed_ranges]
+    checked = known_empty(conn, scope)  # Known-empty IDs count as checked without a request
+    pending = set()
+    live = {}
+    errors = {}
+    probes = 0
+
+    while cursors or pending:
+        chunks = []
+        for cursor in cursors:
+            chunk = list(range(cursor[0], min(cursor[0] + gap, cursor[1] + 1)))
+            cursor[0] += gap
+            chunks.append((cursor, chunk))
+        batch = sorted((pending | {div_id for _, chunk in chunks for div_id in chunk}) - checked)
+        pending.clear()
+
+        payloads = [make_payload(div_id) for div_id in batch]
+        results = []
+        for i, p_content, error in fetch_many(payloads, timeout=timeout):
+            div_id = batch[i]
+            if error:
+                errors[div_id] = error
+                results.append((div_id, 'error', 0, None))
+                continue
+            rows = parse_schedule(p_content) if p_content and len(p_content) > min_content else []
+            if rows:
+                live[div_id] = rows
+            results.append((div_id, 'live' if rows else 'empty', len(rows), len(p_content or '')))
+        checked.update(batch)
+        probes += len(batch)
+        if results:
+            record_probes(conn, scope, sorted(results))
+            print(f"💾 Checkpoint: {len(checked)} IDs checked, {len(live)} live, {len(errors)} failed")
+
+        # Widen around every new hit, past the seed range if need be
+        for div_id in batch:
+            if div_id in live:
+                pending.update(range(max(1, div_id - gap), div_id + gap + 1))
+        pending -= checked
+
+        # A range whose latest chunk had no hits is done
+        for cursor, chunk in chunks:
+            if not any(div_id in live for div_id in chunk):
+                cursor[0] = cursor[1] + 1
+        cursors = [cursor for cursor in cursors if cursor[0] <= cursor[1]]
+
+    return live, errors, probes
@@ -0,0 +1,190 @@
+import re
+from html.parser import HTMLParser
+from typing import NamedTuple, Optional
+
+TEAM_ID_RE = re.compile(r'PAGE_LoadTeam\((\d+)\)')
+
+# Schedule_Row children whose text we keep, mapped to ScheduleRow fields
+TEXT_CLASSES = {
+    "Schedule_Home_Text": "home_team",
+    "Schedule_Away_Text": "guest_team",
+    "Schedule_Home_Division": "home_division",
+    "Schedule_Away_Division": "away_division",
+    "Schedule_Field_Name": "field",
+}
+ONCLICK_CLASSES = {
+    "Schedule_HomeOuter": "home_id",
+    "Schedule_AwayOuter": "away_id",
+}
+
+
+class ScheduleRow(NamedTuple):
+    """One game from a Schedule_Row div. Missing fields are None."""
+    date_text: Optional[str]       # e.g. "Sep 6 - Sat"
+    time_str: Optional[str]        # e.g. "10:00 AM" or "TBD"
+    home_team: Optional[str]
+    guest_team: Optional[str]
+    home_id: Optional[str]         # From PAGE_LoadTeam(...) on Schedule_HomeOuter
+    away_id: Optional[str]         # From PAGE_LoadTeam(...) on Schedule_AwayOuter
+    home_division: Optional[str]
+    away_division: Optional[str]
+    field: Optional[str]
+
+
+def _team_id(onclick):
+    """Pull the team ID out of a PAGE_LoadTeam(...) onclick handler"""
+    match = TEAM_ID_RE.search(onclick or "")
+    return match.group(1) if match else None
+
+
+class _ScheduleRowParser(HTMLParser):
+    """Event-based parser that collects ScheduleRow fields in a single pass.
+
+    Mirrors the BeautifulSoup lookups the scripts used to do: the first matching
+    div in each row wins, the date is the first <b> inside Schedule_Date, and the
+    time is the first div that starts after Schedule_Date (bs4's find_next).
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self.row = None         # Field dict for the row being parsed
+        self.row_depth = 0      # Open divs inside the current row
+        self.captures = []      # [field, div depth to close at (or None for <b>), text parts]
+        self.want_time = False
+        self.want_bold = False
+        self.date_depth = 0     # Depth of the open Schedule_Date div, 0 once closed
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "b":
+            if self.want_bold:
+                self.want_bold = False
+                self.captures.append(["date_text", None, []])
+            return
+        if tag != "div":
+            return
+
+        classes = ()
+        onclick = None
+        for name, value in attrs:
+            if name == "class" and value:
+                classes = value.split()
+            elif name == "onclick":
+                onclick = value
+
+        if self.row is None:
+            if "Schedule_Row" in classes:
+                self.row = {}
+                self.row_depth = 1
+            return
+
+        self.row_depth += 1
+        row = self.row
+        if self.want_time:
+            self.want_time = False
+            self.captures.append(["time_str", self.row_depth, []])
+        for cls in classes:
+            if cls == "Schedule_Date" and "date_text" not in row:
+                row["date_text"] = None
+                self.date_depth = self.row_depth
+                self.want_time = self.want_bold = True
+            field = TEXT_CLASSES.get(cls)
+            if field and field not in row:
+                row[field] = None
+                self.captures.append([field, self.row_depth, []])
+            field = ONCLICK_CLASSES.get(cls)
+            if field and field not in row:
+                row[field] = _team_id(onclick)
+
+    def handle_endtag(self, tag):
+        if self.row is None:
+            return
+        if tag == "b":
+            self._close(None)
+        elif tag == "div":
+            self._close(self.row_depth)
+            if self.row_depth == self.date_depth:
+                self.date_depth = 0
+                self.want_bold = False
+            self.row_depth -= 1
+            if self.row_depth == 0:
+                self._finish_row()
+
+    def handle_data(self, data):
+        for capture in self.captures:
+            capture[2].append(data)
+
+    def _close(self, depth):
+        for capture in [c for c in self.captures if c[1] == depth]:
+            self.captures.remove(capture)
+            self.row[capture[0]] = "".join(capture[2]).strip()
+
+    def _finish_row(self):
+        row = self.row
+        for capture in self.captures:
+            row[capture[0]] = "".join(capture[2]).strip()
+        self.rows.append(ScheduleRow(
+            date_text=row.get("date_text"),
+            time_str=row.get("time_str"),
+            home_team=row.get("home_team"),
+            guest_team=row.get("guest_team"),
+            home_id=row.get("home_id"),
+            away_id=row.get("away_id"),
+            home_division=row.get("home_division"),
+            away_division=row.get("away_division"),
+            field=row.get("field"),
+        ))
+        self.row = None
+        self.captures = []
+        self.want_time = self.want_bold = False
+        self.date_depth = 0
+
+
+def parse_schedule(p_content):
+    """Parse p_Content HTML into a list of ScheduleRow records in one pass"""
+    parser = _ScheduleRowParser()
+    parser.feed(p_content)
+    parser.close()
+    if parser.row is not None:  # Truncated HTML: keep the partial last row
+        parser._finish_row()
+    return parser.rows
+
+
+def iter_schedule(p_content, chunk_size=64 * 1024):
+    """Yield ScheduleRow records as the HTML is parsed, a chunk at a time"""
+    parser = _ScheduleRowParser()
+    for start in range(0, len(p_content), chunk_size):
+        parser.feed(p_content[start:start + chunk_size])
+        yield from parser.rows
+        parser.rows.clear()
+    parser.close()
+    if parser.row is not None:
+        parser._finish_row()
+    yield from parser.rows
+
+
+def parse_schedule_bs4(p_content):
+    """Reference BeautifulSoup implementation, kept as a fallback and for benchmarking"""
+    from bs4 import BeautifulSoup
+
+    def text(elem):
+        return elem.text.strip() if elem else None
+
+    rows = []
+    soup = BeautifulSoup(p_content, 'html.parser')
+    for game in soup.find_all("div", class_="Schedule_Row"):
+        date_div = game.find("div", class_="Schedule_Date")
+        home_outer = game.find("div", class_="Schedule_HomeOuter")
+        away_outer = game.find("div", class_="Schedule_AwayOuter")
+        rows.append(ScheduleRow(
+            date_text=text(date_div.b) if date_div else None,
+            time_str=text(date_div.find_next("div")) if date_div else None,
+            home_team=text(game.find("div", class_="Schedule_Home_Text")),
+            guest_team=text(game.find("div", class_="Schedule_Away_Text")),
+            home_id=_team_id(home_outer.get('onclick')) if home_outer else None,
+            away_id=_team_id(away_outer.get('onclick')) if away_outer else None,
+            home_division=text(game.find("div", class_="Schedule_Home_Division")),
+            away_division=text(game.find("div", class_="Schedule_Away_Division")),
+            field=text(game.find("div", class_="Schedule_Field_Name")),
+        ))
+    return rows
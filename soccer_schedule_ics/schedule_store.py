@@ -0,0 +1,307 @@
+"""Local SQLite store of competitions, divisions, teams, fields and games.
+
+    python -m soccer_schedule_ics.schedule_store sync --competition 12 --division 161 --chunk-weeks 4
+    python -m soccer_schedule_ics.schedule_store teams --name Lakehill
+    python -m soccer_schedule_ics.schedule_store ics --team 841 --output lakehill.ics
+"""
+import argparse
+import sqlite3
+import time
+from datetime import date
+
+from .ics_writer import GameUids
+from .lisa_api import WEEK_MAX, WEEK_MIN, build_payload, fetch_many
+from .metrics import METRICS
+from .refresh_state import fingerprint
+from .schedule_parser import ScheduleRow, parse_schedule
+from .season import parse_week, resolve_date, split_payload
+
+DB_PATH = 'schedule.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS competitions (
+    id TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS divisions (
+    name TEXT PRIMARY KEY,          -- Text shown in Schedule_Home/Away_Division
+    division_id INTEGER,            -- DIVISION filter value, once known
+    competition TEXT REFERENCES competitions(id)
+);
+CREATE INDEX IF NOT EXISTS divisions_by_id ON divisions(division_id);
+CREATE TABLE IF NOT EXISTS teams (
+    id INTEGER PRIMARY KEY,         -- From PAGE_LoadTeam(...)
+    name TEXT NOT NULL,
+    division TEXT REFERENCES divisions(name)
+);
+CREATE INDEX IF NOT EXISTS teams_by_name ON teams(name);
+CREATE INDEX IF NOT EXISTS teams_by_division ON teams(division);
+CREATE TABLE IF NOT EXISTS fields (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS games (
+    uid TEXT PRIMARY KEY,           -- Same UID as the calendar event
+    competition TEXT,               -- Competition the game was fetched with
+    game_date TEXT NOT NULL,        -- ISO date
+    date_text TEXT NOT NULL,
+    time_str TEXT,
+    division_id INTEGER,            -- DIVISION filter the game was fetched with, if any
+    division TEXT,
+    home_team_id INTEGER,
+    away_team_id INTEGER,
+    home_team TEXT,
+    guest_team TEXT,
+    home_division TEXT,
+    away_division TEXT,
+    field_id INTEGER REFERENCES fields(id),
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_home ON games(home_team_id, game_date);
+CREATE INDEX IF NOT EXISTS games_by_away ON games(away_team_id, game_date);
+CREATE INDEX IF NOT EXISTS games_by_division ON games(division_id, game_date);
+CREATE INDEX IF NOT EXISTS games_by_field ON games(field_id, game_date);
+CREATE INDEX IF NOT EXISTS games_by_date ON games(game_date);
+CREATE TABLE IF NOT EXISTS fetches (
+    competition TEXT NOT NULL,
+    division_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    games TEXT NOT NULL,
+    week_min TEXT NOT NULL,
+    week_max TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (competition, division_id, team_id, games, week_min, week_max)
+);
+"""
+
+GAME_COLUMNS = ("date_text, time_str, home_team, guest_team, home_team_id, away_team_id, "
+                "home_division, away_division, (SELECT name FROM fields WHERE fields.id = field_id)")
+
+
+def connect(path=DB_PATH):
+    """Open (and if needed create) the store"""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(SCHEMA)
+    if 'competition' not in {column[1] for column in conn.execute("PRAGMA table_info(games)")}:
+        conn.execute("ALTER TABLE games ADD COLUMN competition TEXT")  # Stores from before games had one
+    conn.execute("CREATE INDEX IF NOT EXISTS games_by_competition ON games(competition, division_id, game_date)")
+    return conn
+
+
+def _as_int(value):
+    return int(value) if value is not None else None
+
+
+def _field_id(conn, name):
+    if not name:
+        return None
+    conn.execute("INSERT OR IGNORE INTO fields(name) VALUES (?)", (name,))
+    return conn.execute("SELECT id FROM fields WHERE name = ?", (name,)).fetchone()[0]
+
+
+def _upsert_team(conn, team_id, name, division):
+    if team_id is None or not name or name == "--":
+        return
+    if division:
+        conn.execute("INSERT OR IGNORE INTO divisions(name) VALUES (?)", (division,))
+    conn.execute(
+        "INSERT INTO teams(id, name, division) VALUES (?, ?, ?) "
+        "ON CONFLICT(id) DO UPDATE SET name = excluded.name, division = COALESCE(excluded.division, teams.division)",
+        (int(team_id), name, division),
+    )
+
+
+def store_rows(conn, rows, competition, division_id=-1, team_id=-1, week_min=None, week_max=None,
+               unplayed_only=False):
+    """Replace the games a fetch covers with the rows it returned.
+
+    Games in the fetch's scope (competition, division/team, week range and,
+    for UNPLAYED fetches, only today onwards) that are no longer listed are deleted, so
+    cancelled games don't linger. Returns the number of games stored.
+    """
+    now = time.time()
+    division_id = int(division_id)
+    team_id = int(team_id)
+    with conn:
+        conn.execute("INSERT OR IGNORE INTO competitions(id) VALUES (?)", (str(competition),))
+
+        scope = ["competition = ?"]
+        params = [str(competition)]
+        if division_id != -1:
+            scope.append("division_id = ?")
+            params.append(division_id)
+        if team_id != -1:
+            scope.append("(home_team_id = ? OR away_team_id = ?)")
+            params += [team_id, team_id]
+        if week_min:
+            scope.append("game_date >= ?")
+            params.append(parse_week(week_min)[0].isoformat())
+        if week_max:
+            scope.append("game_date <= ?")
+            params.append(parse_week(week_max)[1].isoformat())
+        if unplayed_only:
+            scope.append("game_date >= ?")
+            params.append(date.today().isoformat())
+        conn.execute(f"DELETE FROM games WHERE {' AND '.join(scope)}", params)
+
+        stored = 0
+        game_uid = GameUids()
+        for row in rows:
+            if not row.date_text:
+                continue
+            try:
+                year, month, day = resolve_date(row.date_text, week_min or WEEK_MIN, week_max or WEEK_MAX)
+            except (KeyError, ValueError):
+                continue
+            division = row.home_division or row.away_division
+            if division:
+                conn.execute(
+                    "INSERT INTO divisions(name, division_id, competition) VALUES (?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET "
+                    "division_id = COALESCE(excluded.division_id, divisions.division_id), "
+                    "competition = COALESCE(excluded.competition, divisions.competition)",
+                    (division, division_id if division_id != -1 else None, str(competition)),
+                )
+            _upsert_team(conn, row.home_id, row.home_team, row.home_division)
+            _upsert_team(conn, row.away_id, row.guest_team, row.away_division)
+            uid = game_uid(year, month, day, row.home_id or row.home_team or "--", row.away_id or row.guest_team or "--")
+            conn.execute(
+                "INSERT INTO games(uid, competition, game_date, date_text, time_str, division_id, division, "
+                "home_team_id, away_team_id, home_team, guest_team, home_division, away_division, field_id, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(uid) DO UPDATE SET competition = excluded.competition, time_str = excluded.time_str, "
+                "division_id = COALESCE(excluded.division_id, games.division_id), division = excluded.division, "
+                "home_team = excluded.home_team, guest_team = excluded.guest_team, "
+                "home_division = excluded.home_division, away_division = excluded.away_division, "
+                "field_id = excluded.field_id, updated_at = excluded.updated_at",
+                (uid, str(competition), date(year, month, day).isoformat(), row.date_text, row.time_str,
+                 division_id if division_id != -1 else None, division,
+                 _as_int(row.home_id), _as_int(row.away_id), row.home_team, row.guest_team,
+                 row.home_division, row.away_division, _field_id(conn, row.field), now),
+            )
+            stored += 1
+    return stored
+
+
+def _fetch_key(payload, competition, division_id, team_id, games):
+    return (str(competition), int(division_id), int(team_id), str(games), payload['strWeekMin'], payload['strWeekMax'])
+
+
+def sync(conn, competition, division_id=-1, team_id=-1, games="UNPLAYED", week_min=None, week_max=None,
+         chunk_weeks=None):
+    """Fetch a schedule into the store, one week window at a time.
+
+    Windows that have already ended and were fetched before are not requested
+    again, and windows whose content hasn't changed since the last fetch are not
+    re-parsed. Returns (windows fetched, windows changed).
+    """
+    payload = build_payload(competition, division_id, team_id, games=games,
+                            week_min=week_min or WEEK_MIN, week_max=week_max or WEEK_MAX)
+    today = date.today()
+    payloads = []
+    for window in split_payload(payload, chunk_weeks, skip_past=(games == "UNPLAYED")):
+        key = _fetch_key(window, competition, division_id, team_id, games)
+        done = conn.execute("SELECT 1 FROM fetches WHERE competition = ? AND division_id = ? AND team_id = ? "
+                            "AND games = ? AND week_min = ? AND week_max = ?", key).fetchone()
+        if done and parse_week(window['strWeekMax'])[1] < today:
+            continue
+        payloads.append(window)
+
+    changed = 0
+    for i, p_content, error in fetch_many(payloads):
+        window = payloads[i]
+        if error:
+            print(f"❌ Failed to fetch {window['strWeekMin']} - {window['strWeekMax']}: {error}")
+            continue
+        p_content = p_content or ''
+        key = _fetch_key(window, competition, division_id, team_id, games)
+        content_hash = fingerprint(p_content, today=date.min)
+        previous = conn.execute("SELECT fingerprint FROM fetches WHERE competition = ? AND division_id = ? "
+                                "AND team_id = ? AND games = ? AND week_min = ? AND week_max = ?", key).fetchone()
+        if previous is None or previous[0] != content_hash:
+            with METRICS.stage('parse'):
+                rows = parse_schedule(p_content) if p_content else []
+            store_rows(conn, rows, competition, division_id, team_id, window['strWeekMin'], window['strWeekMax'],
+                       unplayed_only=(games == "UNPLAYED"))
+            changed += 1
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO fetches VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                         key + (content_hash, time.time()))
+    return len(payloads), changed
+
+
+def team_rows(conn, team_id, date_from=None, date_to=None, iso_dates=False):
+    """A team's games as ScheduleRows, in date order, from one indexed query.
+
+    With iso_dates, date_text is the stored 'YYYY-MM-DD' date, which
+    resolve_date takes as-is instead of working out the year again.
+    """
+    columns = GAME_COLUMNS.replace('date_text', 'game_date', 1) if iso_dates else GAME_COLUMNS
+    query = (f"SELECT {columns} FROM games WHERE (home_team_id = ? OR away_team_id = ?) "
+             "AND game_date >= ? AND game_date <= ? ORDER BY game_date, time_str")
+    params = (int(team_id), int(team_id), date_from or '0000-00-00', date_to or '9999-99-99')
+    return [ScheduleRow(r[0], r[1], r[2], r[3], _str(r[4]), _str(r[5]), r[6], r[7], r[8])
+            for r in conn.execute(query, params)]
+
+
+def _str(value):
+    return str(value) if value is not None else None
+
+
+def find_teams(conn, name=None, division=None):
+    """(team id, team name, division name, division id) rows matching substrings"""
+    query = ("SELECT teams.id, teams.name, teams.division, divisions.division_id FROM teams "
+             "LEFT JOIN divisions ON divisions.name = teams.division WHERE teams.name LIKE ? "
+             "AND COALESCE(teams.division, '') LIKE ? ORDER BY teams.name, teams.division")
+    return conn.execute(query, (f"%{name or ''}%", f"%{division or ''}%")).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local schedule store")
+    parser.add_argument('--db', default=DB_PATH)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sync_cmd = sub.add_parser('sync', help="Fetch a schedule into the store")
+    sync_cmd.add_argument('--competition', required=True)
+    sync_cmd.add_argument('--division', type=int, default=-1)
+    sync_cmd.add_argument('--team', type=int, default=-1)
+    sync_cmd.add_argument('--games', default="UNPLAYED")
+    sync_cmd.add_argument('--week-min')
+    sync_cmd.add_argument('--week-max')
+    sync_cmd.add_argument('--chunk-weeks', type=int, default=4)
+
+    teams_cmd = sub.add_parser('teams', help="Look up team IDs")
+    teams_cmd.add_argument('--name')
+    teams_cmd.add_argument('--division')
+
+    ics_cmd = sub.add_parser('ics', help="Write a team's calendar from the store")
+    ics_cmd.add_argument('--team', type=int, required=True)
+    ics_cmd.add_argument('--output', required=True)
+    ics_cmd.add_argument('--calendar-name')
+
+    args = parser.parse_args()
+    conn = connect(args.db)
+
+    if args.command == 'sync':
+        fetched, changed = sync(conn, args.competition, args.division, args.team, args.games,
+                                args.week_min, args.week_max, args.chunk_weeks)
+        print(f"✅ Fetched {fetched} week windows, {changed} changed")
+    elif args.command == 'teams':
+        for team_id, name, division, division_id in find_teams(conn, args.name, args.division):
+            print(f"  {name} - Division: {division} ({division_id if division_id is not None else '?'}) - Team ID: {team_id}")
+    elif args.command == 'ics':
+        from .main import stream_calendar
+        from .models import REGISTRY
+
+        name = args.calendar_name
+        if not name:
+            team = conn.execute("SELECT name FROM teams WHERE id = ?", (args.team,)).fetchone()
+            name = f"{team[0] if team else args.team} Schedule"
+        games = REGISTRY.games(team_rows(conn, args.team, iso_dates=True))
+        stream_calendar(games, name, f"Event schedule for {name}", args.output)
+
+
+if __name__ == "__main__":
+    main()
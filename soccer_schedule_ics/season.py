@@ -0,0 +1,170 @@
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+from .lisa_api import WEEK_MAX, WEEK_MIN, fetch_many
+from .metrics import METRICS
+
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+MONTH_MAP = {m: i for i, m in enumerate(MONTH_NAMES, start=1)}
+
+TIMEZONE = ZoneInfo('America/Los_Angeles')
+
+
+def parse_week(week):
+    """'2025|8|18:2025|8|24' -> (date(2025, 8, 18), date(2025, 8, 24))"""
+    start, end = (date(*(int(part) for part in half.split('|'))) for half in week.split(':'))
+    return start, end
+
+
+def format_week(start):
+    """The Monday-Sunday week string the API expects for a week starting at start"""
+    end = start + timedelta(days=6)
+    return f"{start.year}|{start.month}|{start.day}:{end.year}|{end.month}|{end.day}"
+
+
+@lru_cache(maxsize=4096)
+def resolve_date(date_text, week_min=WEEK_MIN, week_max=WEEK_MAX):
+    """'Sep 6 - Sat' -> (2025, 9, 6), taking the year that puts the date inside the requested weeks.
+
+    The API leaves the year out, so it comes from the strWeekMin/strWeekMax the
+    schedule was fetched with; a season spanning New Year gets each month right.
+    ISO dates ('2025-09-06', as stored locally) are passed through.
+    """
+    if not date_text:
+        raise ValueError("Missing date")
+    if date_text[:4].isdigit():
+        iso = date.fromisoformat(date_text)
+        return iso.year, iso.month, iso.day
+    month_str, day_str = date_text.split(' - ')[0].split(' ', 1)
+    month, day = MONTH_MAP[month_str], int(day_str)
+    first = parse_week(week_min)[0]
+    last = parse_week(week_max)[1]
+    best = None
+    for year in range(first.year - 1, last.year + 2):
+        try:
+            candidate = date(year, month, day)
+        except ValueError:  # Feb 29 outside a leap year
+            continue
+        distance = max((first - candidate).days, (candidate - last).days, 0)
+        if best is None or distance < best[0]:
+            best = (distance, year)
+    if best is None:
+        raise ValueError(f"Bad date: {date_text!r}")
+    return best[1], month, day
+
+
+@lru_cache(maxsize=8192)
+def local_datetime(game_date, minutes=0):
+    """Localized datetime for a YYYYMMDD date and minutes after midnight.
+
+    A season has a few hundred distinct dates and a handful of kickoff times,
+    so each (date, time) is localized once per run.
+    """
+    hour, minute = divmod(minutes, 60)
+    return datetime(game_date // 10000, game_date // 100 % 100, game_date % 100, hour, minute, tzinfo=TIMEZONE)
+
+
+def week_windows(week_min, week_max, weeks_per_chunk, skip_past=False, today=None):
+    """Split a strWeekMin..strWeekMax season into (week_min, week_max) windows.
+
+    With skip_past, windows that ended before today are left out entirely.
+    """
+    first, _ = parse_week(week_min)
+    last, _ = parse_week(week_max)
+    today = today or date.today()
+    windows = []
+    start = first
+    while start <= last:
+        end = min(start + timedelta(weeks=weeks_per_chunk - 1), last)
+        if not (skip_past and end + timedelta(days=6) < today):
+            windows.append((format_week(start), format_week(end)))
+        start = end + timedelta(weeks=1)
+    return windows
+
+
+def window_payloads(payload, windows):
+    """Copies of payload, one per (week_min, week_max) window"""
+    return [dict(payload, strWeekMin=week_min, strWeekMax=week_max) for week_min, week_max in windows]
+
+
+def split_payload(payload, weeks_per_chunk, skip_past=False):
+    """Split a payload's season into week-window payloads (just [payload] if weeks_per_chunk is falsy)"""
+    if not weeks_per_chunk:
+        return [payload]
+    windows = week_windows(payload['strWeekMin'], payload['strWeekMax'], weeks_per_chunk, skip_past=skip_past)
+    return window_payloads(payload, windows)
+
+
+def game_key(row):
+    """Identity of a game across overlapping fetches"""
+    return (row.date_text, row.time_str, row.home_id or row.home_team, row.away_id or row.guest_team)
+
+
+def merge_rows(chunks):
+    """Concatenate per-window row lists in order, dropping games seen in an earlier window"""
+    seen = set()
+    merged = []
+    for rows in chunks:
+        for row in rows:
+            key = game_key(row)
+            if key not in seen:
+                seen.add(key)
+                merged.append(row)
+    return merged
+
+
+def fetch_windows(groups, timeout=60):
+    """Fetch every group's week windows concurrently.
+
+    groups maps a key to a list of payloads, one per window. Yields
+    (key, p_content, rows, error) as soon as all of a key's windows are in, where
+    p_content is the windows' HTML joined in order (for fingerprinting). Groups
+    with several windows are parsed chunk by chunk while other windows are still
+    downloading, and rows is their merged list; single-window groups are left
+    unparsed (rows is None) so callers can skip parsing unchanged schedules.
+    A failure in any window fails the whole group, since a partial schedule
+    would look like cancelled games.
+    """
+    keys = []
+    slots = []
+    for key, payloads in groups.items():
+        for window, payload in enumerate(payloads):
+            keys.append(key)
+            slots.append((window, payload))
+
+    pending = {key: len(payloads) for key, payloads in groups.items()}
+    contents = {key: [None] * len(payloads) for key, payloads in groups.items()}
+    parsed = {key: [None] * len(payloads) for key, payloads in groups.items()}
+    failed = {}
+
+    for key, payloads in groups.items():
+        if not payloads:
+            del pending[key]
+            yield key, '', [], None
+
+    for i, p_content, error in fetch_many([payload for _, payload in slots], timeout=timeout):
+        key, (window, _) = keys[i], slots[i]
+        if error:
+            failed.setdefault(key, error)
+        else:
+            contents[key][window] = p_content or ''
+            if len(groups[key]) > 1 and key not in failed:
+                with METRICS.stage('parse'):
+                    from .schedule_parser import parse_schedule  # Single-window runs may never parse
+
+                    parsed[key][window] = parse_schedule(p_content) if p_content else []
+
+        pending[key] -= 1
+        if pending[key]:
+            continue
+        window_contents, window_rows = contents.pop(key), parsed.pop(key)
+        if key in failed:  # Failed windows have no content to join
+            yield key, None, None, failed[key]
+            continue
+        joined = ''.join(window_contents)
+        rows = merge_rows(window_rows) if len(groups[key]) > 1 else None
+        if not joined:
+            yield key, None, None, Exception("❌ No content found in API response.")
+        else:
+            yield key, joined, rows, None
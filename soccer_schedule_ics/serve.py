@@ -0,0 +1,256 @@
+"""Serve the generated calendars over HTTP instead of publishing them to gh-pages.
+
+    python -m soccer_schedule_ics.serve --port 8080 --ttl 900
+    python -m soccer_schedule_ics.serve --config targets.json --port 8080
+    curl http://127.0.0.1:8080/team/841.ics
+    curl http://127.0.0.1:8080/feed/lakehill-home.ics              # a named feed from the config
+    curl 'http://127.0.0.1:8080/feed.ics?division=161&teams=841,842&side=home&from=2025-09-01'
+
+Calendars are rebuilt in the background every --ttl seconds (one upstream
+fetch per division, skipped entirely when the schedule hasn't changed) and
+served from memory. With --config, each division's parsed snapshot is kept, and
+/feed.ics answers any query (see views.FeedQuery) from it, rendering each
+distinct query once per snapshot version. Responses carry an ETag and
+Last-Modified, so polling clients that send If-None-Match / If-Modified-Since
+get a 304 with no body, and gzip is used for clients that accept it.
+"""
+import argparse
+import gzip
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from .main import DEFAULT_OUTPUT, DEFAULT_TEAM, DivisionsFailed, generate_batch, generate_ics, load_targets
+from .views import FeedCache, FeedQuery
+
+DEFAULT_TTL = 900  # Seconds between upstream refreshes (the gh-pages workflow runs every 20 minutes)
+
+_CALENDAR_PATH_RE = re.compile(r'^/((?:team/\d+)|(?:feed/[\w.-]+))\.ics$')
+
+
+class CachedCalendar:
+    """One calendar's bytes, gzipped bytes and validators"""
+
+    def __init__(self, body, last_modified):
+        self.body = body
+        self.gzip_body = gzip.compress(body, mtime=0)
+        digest = hashlib.sha1(body).hexdigest()[:20]
+        self.etag = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gz"'
+        self.last_modified = int(last_modified)
+
+
+def _served_paths(target):
+    """URL paths (without .ics) a config target is served under"""
+    paths = []
+    # /team/<id> is only for plain team calendars; filtered feeds are served by name
+    if target.get('team') is not None and FeedQuery.from_params(target) == FeedQuery(frozenset({int(target['team'])})):
+        paths.append(f"team/{target['team']}")
+    if target.get('name'):
+        paths.append(f"feed/{target['name']}")
+    return paths
+
+
+class CalendarCache:
+    """In-memory calendars by URL path, refreshed from upstream on a background thread"""
+
+    def __init__(self, config_path=None, ttl=DEFAULT_TTL):
+        self.config_path = config_path
+        self.ttl = ttl
+        self.calendars = {}
+        self.snapshots = {}        # (competition, division) -> views.Snapshot; refresh swaps in a new dict
+        self.feeds = FeedCache()
+        self.feed_calendars = OrderedDict()  # (snapshot key, query) -> (snapshot version, CachedCalendar), LRU
+        self.feed_lock = threading.Lock()
+        self.stopped = threading.Event()
+
+    def outputs(self):
+        """URL path (e.g. 'team/841') -> .ics path for every calendar being served"""
+        if not self.config_path:
+            return {f"team/{DEFAULT_TEAM}": DEFAULT_OUTPUT}
+        groups = load_targets(self.config_path)[0]
+        return {path: target['output'] for targets in groups.values() for target in targets
+                for path in _served_paths(target)}
+
+    def refresh(self):
+        """Regenerate the calendars and load any that changed into memory"""
+        try:
+            if self.config_path:
+                # Filled in a copy so /feed.ics requests never iterate a dict that is being updated
+                snapshots = dict(self.snapshots)
+                try:
+                    generate_batch(self.config_path, snapshots=snapshots)
+                except DivisionsFailed as e:
+                    print(f"⚠️  {e}; still serving their previous calendars")
+                self.snapshots = snapshots
+            else:
+                generate_ics()
+        except Exception as e:
+            print(f"❌ Refresh failed, still serving the previous calendars: {e}")
+            return
+
+        calendars = dict(self.calendars)
+        for path, output in self.outputs().items():
+            try:
+                with open(output, 'rb') as ics_file:
+                    body = ics_file.read()
+            except FileNotFoundError:
+                continue
+            calendars[path] = _updated(calendars.get(path), body)
+        self.calendars = calendars  # Swapped in whole so request threads never see a partial update
+
+    def get(self, path):
+        return self.calendars.get(path)
+
+    def feed(self, params):
+        """The calendar for a /feed.ics query, or None if its division isn't being fetched.
+
+        params are the URL's parameters: division (required), competition
+        (if several share the division ID) and anything FeedQuery.from_params takes.
+        """
+        division = params.get('division')
+        competition = params.get('competition')
+        matches = [snapshot for key, snapshot in self.snapshots.items()
+                   if key[1] == division and competition in (None, key[0])]
+        if len(matches) != 1:
+            return None
+        snapshot = matches[0]
+        query = FeedQuery.from_params(params)
+        memo_key = (snapshot.key, query)
+        with self.feed_lock:
+            cached = self.feed_calendars.get(memo_key)
+            if cached and cached[0] == snapshot.version:
+                self.feed_calendars.move_to_end(memo_key)
+                return cached[1]
+        with open(self.feeds.render(snapshot, query), 'rb') as ics_file:
+            calendar = _updated(cached[1] if cached else None, ics_file.read())
+        with self.feed_lock:
+            self.feed_calendars[memo_key] = (snapshot.version, calendar)
+            self.feed_calendars.move_to_end(memo_key)
+            while len(self.feed_calendars) > self.feeds.max_feeds:
+                self.feed_calendars.popitem(last=False)
+        return calendar
+
+    def run(self):
+        while not self.stopped.wait(self.ttl):
+            self.refresh()
+
+    def start(self):
+        """Load the calendars once, then keep refreshing them every ttl seconds"""
+        self.refresh()
+        threading.Thread(target=self.run, daemon=True).start()
+
+
+def _updated(current, body):
+    """current if body is unchanged, else a new CachedCalendar for body"""
+    # Unchanged events are rewritten byte-for-byte, so equal bytes mean an unchanged calendar
+    if current is not None and current.body == body:
+        return current
+    return CachedCalendar(body, time.time())
+
+
+def _etag_matches(header, calendar):
+    if header.strip() == '*':
+        return True
+    tags = {tag.strip().removeprefix('W/') for tag in header.split(',')}
+    return calendar.etag in tags or calendar.gzip_etag in tags
+
+
+def _not_modified_since(header, calendar):
+    try:
+        since = parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return calendar.last_modified <= since
+
+
+def make_handler(cache, quiet=False):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            self.serve(send_body=True)
+
+        def do_HEAD(self):
+            self.serve(send_body=False)
+
+        def serve(self, send_body):
+            path, _, query_string = self.path.partition('?')
+            if path == '/feed.ics':
+                params = {name: values[0] for name, values in parse_qs(query_string).items()}
+                try:
+                    calendar = cache.feed(params)
+                except ValueError as e:
+                    return self.reply(400, f"{e}\n".encode(), {"Content-Type": "text/plain"}, send_body)
+            else:
+                match = _CALENDAR_PATH_RE.match(path)
+                calendar = cache.get(match.group(1)) if match else None
+            if calendar is None:
+                return self.reply(404, b"Unknown calendar\n", {"Content-Type": "text/plain"}, send_body)
+
+            use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+            headers = {
+                "ETag": calendar.gzip_etag if use_gzip else calendar.etag,
+                "Last-Modified": formatdate(calendar.last_modified, usegmt=True),
+                "Cache-Control": f"public, max-age={int(cache.ttl)}",
+                "Vary": "Accept-Encoding",
+            }
+            if_none_match = self.headers.get('If-None-Match')
+            if_modified_since = self.headers.get('If-Modified-Since')
+            if (_etag_matches(if_none_match, calendar) if if_none_match is not None
+                    else if_modified_since is not None and _not_modified_since(if_modified_since, calendar)):
+                return self.reply(304, b"", headers, send_body)
+
+            headers["Content-Type"] = "text/calendar; charset=utf-8"
+            if use_gzip:
+                headers["Content-Encoding"] = "gzip"
+            self.reply(200, calendar.gzip_body if use_gzip else calendar.body, headers, send_body)
+
+        def reply(self, status, body, headers, send_body):
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            if status != 304:
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if send_body and status != 304:
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            if not quiet:
+                super().log_message(format, *args)
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve team calendars with ETag/304 and gzip support")
+    parser.add_argument('--config', help="Batch config listing the teams to serve (default: the main.py calendar)")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--ttl', type=float, default=DEFAULT_TTL, help="Seconds between upstream refreshes")
+    parser.add_argument('--quiet', action='store_true', help="Don't log each request")
+    args = parser.parse_args()
+
+    cache = CalendarCache(args.config, args.ttl)
+    cache.start()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(cache, args.quiet))
+    server.daemon_threads = True
+    print(f"Serving {', '.join(f'/{path}.ics' for path in sorted(cache.calendars)) or 'no calendars yet'} "
+          f"on http://{args.host}:{args.port} (refreshing every {args.ttl:g}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        cache.stopped.set()
+
+
+if __name__ == "__main__":
+    main()
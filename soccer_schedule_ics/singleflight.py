@@ -0,0 +1,42 @@
+"""Coalesce concurrent identical calls into one.
+
+While a call for a key is in flight, other callers asking for the same key
+wait for it and get its result (or its exception) instead of starting their
+own. Nothing is kept once the call finishes, so this only collapses bursts
+(e.g. every subscriber refreshing at once); caching is the response cache's job.
+Results are shared between callers, so they should be immutable.
+"""
+import threading
+from concurrent.futures import Future
+
+from .metrics import METRICS
+
+
+class SingleFlight:
+    def __init__(self, name):
+        self.name = name          # Counted as '<name>_coalesced' when a caller shares another's call
+        self.lock = threading.Lock()
+        self.calls = {}           # key -> Future of the call in flight
+
+    def do(self, key, func, *args):
+        """func(*args), unless a call for key is already running, in which case wait for and return its result"""
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = self.calls[key] = Future()
+        if not leader:
+            METRICS.count(f'{self.name}_coalesced')
+            return future.result()
+
+        try:
+            result = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                del self.calls[key]
@@ -0,0 +1,209 @@
+"""Calendar feeds defined as queries over one parsed division snapshot.
+
+A feed is a query rather than its own fetch:
+
+    {"competition": 12, "division": 161, "teams": [841, 842], "side": "home",
+     "field": "Lakehill Turf", "from": "2025-09-01", "to": "2025-12-31", "include_tbd": false}
+
+A Snapshot holds one division's games from a single fetch and parse, versioned
+by the response's fingerprint, and answers queries from a per-team index.
+Rendered feeds are memoized by (query, snapshot version), so any number of
+subscriptions over a division cost one fetch and one parse per refresh, and a
+feed is only re-rendered when the snapshot it was cut from changes. Only the
+MAX_FEEDS most recently used feeds are kept, since anyone can make up a query.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import NamedTuple, Optional
+
+from .metrics import METRICS
+from .models import date_int
+from .singleflight import SingleFlight
+
+FEEDS_DIR = '.feeds'  # Where per-subscriber feeds are rendered (their SEQUENCE history lives there)
+MAX_FEEDS = 256      # Rendered feeds kept, memo entries and files; the least recently used go first
+SIDES = ('any', 'home', 'away')
+
+_FALSE = {'0', 'false', 'no', 'off'}
+
+
+def _iso_date(value):
+    if value in (None, ''):
+        return None
+    value = date.fromisoformat(str(value).strip())
+    return date_int(value.year, value.month, value.day)
+
+
+def _iso(day):
+    return f"{day // 10000:04d}-{day // 100 % 100:02d}-{day % 100:02d}" if day else None
+
+
+def _team_ids(value):
+    if value in (None, ''):
+        return ()
+    if isinstance(value, (int, str)):
+        value = str(value).split(',')
+    return tuple(int(team) for team in value if str(team).strip())
+
+
+class FeedQuery(NamedTuple):
+    """Which games of a snapshot a feed shows. Hashable, so it can key the render memo."""
+    teams: frozenset = frozenset()   # Team IDs; empty means every team in the division
+    side: str = 'any'                # 'home' / 'away': only games where one of teams plays on that side
+    field: Optional[str] = None      # Only games at this field (case-insensitive)
+    date_from: Optional[int] = None  # YYYYMMDD, inclusive
+    date_to: Optional[int] = None
+    include_tbd: bool = True         # False drops games without a kickoff time
+
+    @classmethod
+    def from_params(cls, params):
+        """A query from a batch config target or URL parameters (values may be strings).
+
+        'team' and 'teams' both accept an ID, a list or a comma-separated string.
+        """
+        side = str(params.get('side') or 'any').lower()
+        if side not in SIDES:
+            raise ValueError(f"side must be one of {', '.join(SIDES)}, not {side!r}")
+        include_tbd = params.get('include_tbd', True)
+        if isinstance(include_tbd, str):
+            include_tbd = include_tbd.strip().lower() not in _FALSE
+        return cls(
+            teams=frozenset(_team_ids(params.get('team')) + _team_ids(params.get('teams'))),
+            side=side,
+            field=(params.get('field') or '').strip() or None,
+            date_from=_iso_date(params.get('from')),
+            date_to=_iso_date(params.get('to')),
+            include_tbd=bool(include_tbd),
+        )
+
+    def key(self):
+        """Short stable digest of the query, for file names and change fingerprints"""
+        text = "|".join(map(str, (sorted(self.teams), self.side, (self.field or '').lower(),
+                                  self.date_from, self.date_to, self.include_tbd)))
+        return hashlib.sha1(text.encode()).hexdigest()[:12]
+
+    def describe(self):
+        """'Teams 841, 842 · home games · Lakehill Turf · 2025-09-01 to 2025-12-31'"""
+        parts = [f"Teams {', '.join(map(str, sorted(self.teams)))}" if self.teams else "All teams"]
+        if self.side != 'any':
+            parts.append(f"{self.side} games")
+        if self.field:
+            parts.append(self.field)
+        if self.date_from or self.date_to:
+            parts.append(f"{_iso(self.date_from) or 'start'} to {_iso(self.date_to) or 'end'}")
+        if not self.include_tbd:
+            parts.append("scheduled times only")
+        return " · ".join(parts)
+
+    def on_side(self, game):
+        """Whether one of teams plays game on the requested side (always true without teams)"""
+        if not self.teams or self.side == 'any':
+            return True
+        team = game.home if self.side == 'home' else game.away
+        return team is not None and team.id in self.teams
+
+    def matches(self, game):
+        """The field, date and TBD filters. Team filtering is done by Snapshot.select (it uses the index)."""
+        if self.date_from is not None and game.date < self.date_from:
+            return False
+        if self.date_to is not None and game.date > self.date_to:
+            return False
+        if self.field is not None and (game.field or '').lower() != self.field.lower():
+            return False
+        return self.include_tbd or game.time is not None
+
+
+class Snapshot:
+    """One division's games from a single fetch and parse, with a per-team index"""
+    __slots__ = ('key', 'version', 'games', 'by_team')
+
+    def __init__(self, key, version, games):
+        self.key = key            # (competition, division)
+        self.version = version    # Fingerprint of the response the games were parsed from
+        self.games = list(games)
+        self.by_team = {}         # Team ID -> positions in games
+        for position, game in enumerate(self.games):
+            for team in {game.home, game.away}:
+                if team is not None and team.id is not None:
+                    self.by_team.setdefault(team.id, []).append(position)
+
+    def team_games(self, query):
+        """Games involving any of query's teams, on its side, in schedule order (all games without teams)"""
+        if not query.teams:
+            return list(self.games)
+        positions = set()
+        for team_id in query.teams:
+            positions.update(self.by_team.get(team_id, ()))
+        games = (self.games[position] for position in sorted(positions))
+        return [game for game in games if query.on_side(game)]
+
+    def select(self, query):
+        """The games a query's feed shows"""
+        return [game for game in self.team_games(query) if query.matches(game)]
+
+
+def filter_feed(games, query):
+    """Apply a query's field/date/TBD filters to games that didn't come from a snapshot (e.g. exhibitions merged in)"""
+    return (game for game in games if query.matches(game))
+
+
+class FeedCache:
+    """Per-subscriber feeds, rendered to FEEDS_DIR once per (query, snapshot version).
+
+    Feeds are written with the usual incremental writer, so a subscriber's
+    calendar keeps its UIDs and SEQUENCE history across refreshes. A memo entry
+    is replaced once its snapshot has a newer version. Beyond max_feeds, the
+    least recently used feed is dropped along with its file.
+    """
+
+    def __init__(self, directory=FEEDS_DIR, max_feeds=MAX_FEEDS):
+        self.directory = directory
+        self.max_feeds = max_feeds
+        self.rendered = OrderedDict()   # (snapshot key, query) -> (version, path), least recently used first
+        self.lock = threading.Lock()    # Guards rendered only; different feeds render concurrently
+        self.renders = SingleFlight('feed_renders')
+
+    def path(self, snapshot, query):
+        competition, division = snapshot.key
+        return os.path.join(self.directory, f"{competition}-{division}-{query.key()}.ics")
+
+    def render(self, snapshot, query, now=None):
+        """Path of the query's feed over snapshot, rendering it only if this version hasn't been yet.
+
+        The calendar's name is derived from the query, since one file serves
+        every subscriber asking for it.
+        """
+        memo_key = (snapshot.key, query)
+        while True:
+            with self.lock:
+                cached = self.rendered.get(memo_key)
+                if cached and cached[0] == snapshot.version and os.path.exists(cached[1]):
+                    self.rendered.move_to_end(memo_key)
+                    METRICS.count('feeds_reused')
+                    return cached[1]
+            # One render per feed at a time (they share a file); a caller that waited
+            # on a render of an older version loops and renders its own
+            self.renders.do(memo_key, self._render, snapshot, query, now)
+
+    def _render(self, snapshot, query, now):
+        from .main import stream_calendar
+
+        os.makedirs(self.directory, exist_ok=True)
+        output = self.path(snapshot, query)
+        competition, division = snapshot.key
+        stream_calendar(snapshot.select(query), f"Division {division} feed",
+                        f"{query.describe()} (competition {competition}, division {division})", output, now)
+        METRICS.count('feeds_rendered')
+        with self.lock:
+            self.rendered[(snapshot.key, query)] = (snapshot.version, output)
+            self.rendered.move_to_end((snapshot.key, query))
+            while len(self.rendered) > self.max_feeds:
+                _, (_, path) = self.rendered.popitem(last=False)
+                METRICS.count('feeds_evicted')
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass